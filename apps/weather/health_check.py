@@ -0,0 +1,93 @@
+# apps/weather/health_check.py
+"""
+헬스체크 ASGI 인터셉터
+
+Kubernetes liveness/readiness 프로브 요청을 Django 미들웨어 스택 앞에서 처리
+- /healthz (liveness): 프로세스가 응답하면 항상 200 (외부 Provider 상태와 무관)
+- /readyz (readiness): 공유 캐시(Redis) 조회가 되면 200, Provider 상태는 본문에만 표시
+  (Provider 실패 기록은 모든 Pod가 공유하므로 준비 상태 판단에 사용하지 않음)
+"""
+
+import json
+import logging
+
+from asgiref.sync import sync_to_async
+
+from apps.weather.services.api_router import get_api_router
+
+logger = logging.getLogger(__name__)
+
+LIVENESS_PATH = "/healthz"
+READINESS_PATH = "/readyz"
+HEALTH_CHECK_PATHS = frozenset({LIVENESS_PATH, READINESS_PATH})
+
+# liveness 응답 본문 (외부 API 장애 중에도 Pod를 재시작하지 않도록 고정 응답)
+LIVENESS_BODY = json.dumps({"status": "alive"}).encode()
+
+
+class HealthCheckInterceptor:
+    """
+    헬스체크 경로만 직접 응답하고 나머지 요청은 내부 ASGI 앱으로 전달
+
+    응답:
+    - /healthz 200: 프로세스 정상 (Provider 상태는 조회하지 않음)
+    - /readyz 200: 캐시 조회 성공 (본문 upstream/providers에 Provider 상태 포함)
+    - /readyz 503: 캐시 조회 실패 (이 Pod에서 요청을 처리할 수 없음)
+    - 405: GET 이외의 메서드
+    """
+
+    def __init__(self, app):
+        """
+        Args:
+            app: 내부 ASGI 애플리케이션 (Django)
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in HEALTH_CHECK_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] != "GET":
+            await self._send_response(send, 405, b"", [(b"allow", b"GET")])
+            return
+
+        if scope["path"] == LIVENESS_PATH:
+            await self._send_response(
+                send, 200, LIVENESS_BODY, [(b"content-type", b"application/json")]
+            )
+            return
+
+        try:
+            summary = await sync_to_async(
+                get_api_router().get_health_summary, thread_sensitive=False
+            )()
+        except Exception as e:
+            logger.error("[HealthCheck] Failed to read provider status: %s", e)
+            status_code = 503
+            body = json.dumps({"status": "not_ready"}).encode()
+        else:
+            # 모든 Provider가 실패 상태여도 Ready 유지 (stale 응답 제공, 트래픽으로 복구 시도)
+            status_code = 200
+            body = json.dumps(
+                {
+                    "status": "ready",
+                    "upstream": summary["status"],
+                    "providers": summary["providers"],
+                }
+            ).encode()
+
+        await self._send_response(
+            send, status_code, body, [(b"content-type", b"application/json")]
+        )
+
+    async def _send_response(self, send, status_code, body, headers):
+        """ASGI 응답 전송"""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": headers + [(b"content-length", str(len(body)).encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -7,9 +7,11 @@ API Provider 패키지
 from .base import IWeatherAPIProvider
 from .scraping_provider import ScrapingWeatherProvider
 from .external_provider import ExternalWeatherProvider
+from .registry import get_default_providers
 
 __all__ = [
     "IWeatherAPIProvider",
     "ScrapingWeatherProvider",
     "ExternalWeatherProvider",
+    "get_default_providers",
 ]
@@ -5,12 +5,34 @@ API Provider 기본 인터페이스
 모든 날씨 API Provider가 구현해야 하는 공통 인터페이스 정의
 """
 
-from typing import Protocol
+import asyncio
+import functools
+import inspect
+import logging
+import threading
+import weakref
+from typing import Dict, Protocol
+import httpx
+import requests
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
 from apps.weather.services.weather_api.schemas import (
     WeatherForecastRequestSchema,
     WeatherForecastResponseSchema,
+    WeatherAPIResponseSchema,
 )
 
+logger = logging.getLogger(__name__)
+
+# 헬스체크 결과 캐시
+HEALTH_CHECK_KEY_PREFIX = "api:health_check"
+HEALTH_CHECK_CACHE_TTL = 15  # 15초
+
+# 헬스체크 요청 타임아웃 (초, 재시도 없이 한 번만 호출)
+HEALTH_CHECK_TIMEOUT = 5
+
 
 class IWeatherAPIProvider(Protocol):
     """
@@ -18,36 +40,39 @@ class IWeatherAPIProvider(Protocol):
 
     동일한 기능을 제공하는 여러 API를 추상화하기 위한 인터페이스
     각 Provider는 다음을 구현해야 합니다:
-    - 날씨 예보 조회
+    - 날씨 예보 조회 (동기/비동기)
     - 헬스체크
     - Provider 메타데이터 (이름, 비용)
     """
 
-    @property
-    def provider_name(self) -> str:
-        """
-        Provider 이름
+    # Provider 식별자 (예: "scraping", "external")
+    provider_name: str
 
-        Returns:
-            str: Provider 식별자 (예: "scraping", "external")
-        """
-        ...
+    # 요청당 비용 (USD, 0.0 = 무료)
+    cost_per_request: float
 
-    @property
-    def cost_per_request(self) -> float:
+    def get_weather_forecast(
+        self, request_data: WeatherForecastRequestSchema
+    ) -> WeatherForecastResponseSchema:
         """
-        요청당 비용 (USD)
+        날씨 예보 조회
+
+        Args:
+            request_data: 날씨 예보 요청 데이터
 
         Returns:
-            float: 요청 1회당 비용 (0.0 = 무료)
+            WeatherForecastResponseSchema: 날씨 예보 응답
+
+        Raises:
+            Exception: API 호출 실패
         """
         ...
 
-    def get_weather_forecast(
+    async def get_weather_forecast_async(
         self, request_data: WeatherForecastRequestSchema
     ) -> WeatherForecastResponseSchema:
         """
-        날씨 예보 조회
+        날씨 예보 조회 (비동기)
 
         Args:
             request_data: 날씨 예보 요청 데이터
@@ -70,3 +95,179 @@ class IWeatherAPIProvider(Protocol):
             bool: True=정상, False=장애
         """
         ...
+
+    async def health_check_async(self) -> bool:
+        """
+        API 헬스체크 (비동기)
+
+        Returns:
+            bool: True=정상, False=장애
+        """
+        ...
+
+    async def aclose_async_client(self) -> None:
+        """
+        현재 이벤트 루프에서 사용한 비동기 HTTP 클라이언트 종료
+
+        호출을 위해 만든 이벤트 루프를 닫기 전에 호출
+        """
+        ...
+
+
+class BaseHTTPWeatherProvider:
+    """
+    HTTP 기반 Provider 공통 구현
+
+    커넥션 풀 세션, 이벤트 루프별 AsyncClient, 응답 데이터 추출을 공유
+    하위 클래스는 provider_name, cost_per_request, 엔드포인트, log_name을 정의
+    """
+
+    __slots__ = ("api_key", "timeout", "session", "_async_clients", "_async_clients_lock")
+
+    # 로그 접두사 (예: "ScrapingProvider")
+    log_name = "Provider"
+
+    # 헬스체크 엔드포인트 (하위 클래스에서 정의)
+    health_endpoint = ""
+
+    def __init__(self, api_key: str, timeout: int = 10):
+        """
+        Args:
+            api_key: API 키
+            timeout: 요청 타임아웃 (초)
+        """
+        self.api_key = api_key
+        self.timeout = timeout
+        self.session = self._create_session()
+
+        # 이벤트 루프별 AsyncClient (클라이언트는 생성한 루프에서만 사용 가능)
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._async_clients_lock = threading.Lock()
+
+    def _default_headers(self) -> Dict[str, str]:
+        """세션과 AsyncClient에 공통으로 붙일 헤더 (기본값: 없음)"""
+        return {}
+
+    def _extract_data(
+        self, api_response: WeatherAPIResponseSchema
+    ) -> WeatherForecastResponseSchema:
+        """
+        검증된 API 응답에서 예보 데이터 추출
+
+        Raises:
+            Exception: 에러 응답이거나 데이터가 없는 경우
+        """
+        # 에러 응답 처리
+        if api_response.is_error:
+            logger.error("[%s] API Error: %s", self.log_name, api_response.error_message)
+            raise Exception(f"API Error: {api_response.error_message}")
+
+        # 성공 시 데이터만 반환
+        if api_response.data is None:
+            raise Exception("API returned success but no data")
+
+        logger.info("[%s] API call successful", self.log_name)
+        return api_response.data
+
+    def _create_session(self) -> requests.Session:
+        """
+        커넥션 풀을 재사용하는 requests.Session 생성
+
+        호출마다 TCP/TLS 연결을 새로 맺지 않도록 keep-alive 세션 사용
+        예보 호출은 1회 재시도, 헬스체크는 재시도 없음
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(total=1, backoff_factor=0.1),
+        )
+        session.mount("https://", adapter)
+
+        # 헬스체크는 재시도하지 않음 (프로브 한 번이 HEALTH_CHECK_TIMEOUT 안에 끝나도록)
+        # requests는 가장 긴 접두사의 어댑터를 사용하므로 헬스체크 URL에만 적용
+        if self.health_endpoint:
+            session.mount(self.health_endpoint, HTTPAdapter(max_retries=0))
+
+        session.headers.update(self._default_headers())
+        return session
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        현재 이벤트 루프용 httpx.AsyncClient 반환
+
+        같은 이벤트 루프 안에서는 커넥션 풀을 재사용하고, 다른 스레드의
+        이벤트 루프가 만든 클라이언트는 공유하지 않음
+        aclose_async_client 없이 닫힌 루프의 클라이언트는 새 클라이언트 생성 시 정리
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                self._discard_closed_loop_clients()
+                client = httpx.AsyncClient(headers=self._default_headers())
+                self._async_clients[loop] = client
+        return client
+
+    def _discard_closed_loop_clients(self):
+        """
+        닫힌 이벤트 루프의 클라이언트 참조 제거 (_async_clients_lock 보유 상태에서 호출)
+
+        닫힌 루프에서는 aclose()를 실행할 수 없으므로 참조만 끊어 소켓을 GC에 맡김
+        """
+        for loop in [loop for loop in self._async_clients if loop.is_closed()]:
+            logger.warning(
+                "[%s] Discarding AsyncClient of a closed event loop", self.log_name
+            )
+            del self._async_clients[loop]
+
+    async def aclose_async_client(self) -> None:
+        """
+        현재 이벤트 루프의 AsyncClient 종료
+
+        호출을 위해 만든 이벤트 루프를 닫기 전에 호출 (커넥션 누수 방지)
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+def cached_health_check(func):
+    """
+    health_check 결과를 짧은 TTL로 캐싱하는 데코레이터
+
+    TTL 동안은 같은 Provider에 대한 헬스체크 요청을 다시 보내지 않고
+    캐시된 결과(True/False)를 반환
+    동기/비동기 헬스체크 모두 같은 캐시 키를 공유
+    """
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self) -> bool:
+            cache_key = f"{HEALTH_CHECK_KEY_PREFIX}:{self.provider_name}"
+            # 이벤트 루프를 막지 않도록 비동기 캐시 API 사용
+            cached_result = await cache.aget(cache_key)
+            if cached_result is not None:
+                return cached_result
+
+            is_healthy = await func(self)
+            await cache.aset(cache_key, is_healthy, HEALTH_CHECK_CACHE_TTL)
+            return is_healthy
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self) -> bool:
+        cache_key = f"{HEALTH_CHECK_KEY_PREFIX}:{self.provider_name}"
+        cached_result = cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+
+        is_healthy = func(self)
+        cache.set(cache_key, is_healthy, HEALTH_CHECK_CACHE_TTL)
+        return is_healthy
+
+    return wrapper
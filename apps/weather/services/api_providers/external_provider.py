@@ -8,8 +8,17 @@
 - 안정성: 높음
 """
 
+import httpx
 import requests
 import logging
+from functools import lru_cache
+from typing import Dict
+from pydantic_core import to_json
+from apps.weather.services.api_providers.base import (
+    HEALTH_CHECK_TIMEOUT,
+    BaseHTTPWeatherProvider,
+    cached_health_check,
+)
 from apps.weather.services.weather_api.schemas import (
     WeatherForecastRequestSchema,
     WeatherForecastResponseSchema,
@@ -18,8 +27,10 @@ from apps.weather.services.weather_api.schemas import (
 
 logger = logging.getLogger(__name__)
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
-class ExternalWeatherProvider:
+class ExternalWeatherProvider(BaseHTTPWeatherProvider):
     """
     외부 유료 날씨 API Provider
 
@@ -27,23 +38,16 @@ class ExternalWeatherProvider:
     실제 사용 시 외부 API 스펙에 맞춰 수정 필요
     """
 
-    def __init__(self, api_key: str, timeout: int = 10):
-        """
-        Args:
-            api_key: 외부 API 키
-            timeout: 요청 타임아웃 (초)
-        """
-        self.api_key = api_key
-        self.base_url = "https://api.external-weather-service.com"
-        self.timeout = timeout
+    __slots__ = ()
 
-    @property
-    def provider_name(self) -> str:
-        return "external"
+    log_name = "ExternalProvider"
 
-    @property
-    def cost_per_request(self) -> float:
-        return 0.01  # $0.01 per request
+    provider_name = "external"
+    cost_per_request = 0.01  # $0.01 per request
+
+    base_url = "https://api.external-weather-service.com"
+    forecast_endpoint = f"{base_url}/api/v2/forecast"
+    health_endpoint = f"{base_url}/health"
 
     def get_weather_forecast(
         self, request_data: WeatherForecastRequestSchema
@@ -61,105 +65,191 @@ class ExternalWeatherProvider:
             requests.RequestException: 네트워크 오류
             Exception: API 오류
         """
-        endpoint = f"{self.base_url}/api/v2/forecast"
+        endpoint = self.forecast_endpoint
 
         try:
             # 외부 API는 다른 바디 구조를 사용할 수 있음
-            body_data = self._convert_to_external_format(request_data)
+            body = self._convert_to_external_format(request_data)
 
             logger.info(
-                f"[ExternalProvider] Calling API: {endpoint} for city={request_data.location.city}"
+                "[ExternalProvider] Calling API: %s for city=%s",
+                endpoint, request_data.location.city,
             )
 
-            response = requests.post(
+            response = self.session.post(
                 endpoint,
-                json=body_data,
-                headers={"X-API-Key": self.api_key},
+                data=body,
+                headers=JSON_HEADERS,
                 timeout=self.timeout,
             )
             response.raise_for_status()
 
             # 외부 API 응답을 내부 스키마로 변환
-            api_response = self._convert_from_external_format(response.json())
-
-            # 에러 응답 처리
-            if api_response.is_error:
-                logger.error(
-                    f"[ExternalProvider] API Error: {api_response.error_message}"
-                )
-                raise Exception(f"API Error: {api_response.error_message}")
-
-            # 성공 시 데이터만 반환
-            if api_response.data is None:
-                raise Exception("API returned success but no data")
+            api_response = self._convert_from_external_format(response.content)
 
-            logger.info("[ExternalProvider] API call successful")
-            return api_response.data
+            return self._extract_data(api_response)
 
         except requests.Timeout:
             logger.error("[ExternalProvider] Request timeout")
             raise Exception("External API timeout")
         except requests.RequestException as e:
-            logger.error(f"[ExternalProvider] Network error: {e}")
+            logger.error("[ExternalProvider] Network error: %s", e)
             raise Exception(f"External API network error: {e}")
         except Exception as e:
-            logger.error(f"[ExternalProvider] Unexpected error: {e}")
+            logger.error("[ExternalProvider] Unexpected error: %s", e)
             raise
 
+    async def get_weather_forecast_async(
+        self, request_data: WeatherForecastRequestSchema
+    ) -> WeatherForecastResponseSchema:
+        """
+        외부 API로 날씨 예보 조회 (비동기)
+
+        get_weather_forecast와 동일한 동작을 httpx.AsyncClient로 수행
+
+        Args:
+            request_data: 날씨 예보 요청 데이터
+
+        Returns:
+            WeatherForecastResponseSchema: 날씨 예보 응답
+
+        Raises:
+            Exception: API 오류, 타임아웃, 네트워크 오류
+        """
+        endpoint = self.forecast_endpoint
+
+        try:
+            body = self._convert_to_external_format(request_data)
+
+            logger.info(
+                "[ExternalProvider] Calling API (async): %s for city=%s",
+                endpoint, request_data.location.city,
+            )
+
+            client = self._get_async_client()
+            response = await client.post(
+                endpoint,
+                content=body,
+                headers=JSON_HEADERS,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+
+            api_response = self._convert_from_external_format(response.content)
+            return self._extract_data(api_response)
+
+        except httpx.TimeoutException:
+            logger.error("[ExternalProvider] Request timeout")
+            raise Exception("External API timeout")
+        except httpx.HTTPError as e:
+            logger.error("[ExternalProvider] Network error: %s", e)
+            raise Exception(f"External API network error: {e}")
+        except Exception as e:
+            logger.error("[ExternalProvider] Unexpected error: %s", e)
+            raise
+
+    @cached_health_check
     def health_check(self) -> bool:
         """
         헬스체크: 실제 API 엔드포인트에 ping 요청
 
+        결과는 짧은 TTL 동안 캐싱되어 연속 호출 시 재요청하지 않음
+
         Returns:
             bool: True=정상, False=장애
         """
         try:
-            health_endpoint = f"{self.base_url}/health"
-            response = requests.get(
-                health_endpoint,
-                headers={"X-API-Key": self.api_key},
-                timeout=5,
+            response = self.session.get(self.health_endpoint, timeout=HEALTH_CHECK_TIMEOUT)
+            is_healthy = response.status_code == 200
+
+            logger.info(
+                "[ExternalProvider] Health check: %s",
+                'OK' if is_healthy else 'FAIL',
             )
+            return is_healthy
+
+        except Exception as e:
+            logger.warning("[ExternalProvider] Health check failed: %s", e)
+            return False
+
+    @cached_health_check
+    async def health_check_async(self) -> bool:
+        """
+        헬스체크 (비동기)
+
+        이벤트 루프별 AsyncClient를 재사용하므로 DNS 조회와 TLS 연결을
+        요청 호출과 공유
+
+        Returns:
+            bool: True=정상, False=장애
+        """
+        try:
+            client = self._get_async_client()
+            response = await client.get(self.health_endpoint, timeout=HEALTH_CHECK_TIMEOUT)
             is_healthy = response.status_code == 200
 
             logger.info(
-                f"[ExternalProvider] Health check: {'OK' if is_healthy else 'FAIL'}"
+                "[ExternalProvider] Async health check: %s",
+                'OK' if is_healthy else 'FAIL',
             )
             return is_healthy
 
         except Exception as e:
-            logger.warning(f"[ExternalProvider] Health check failed: {e}")
+            logger.warning("[ExternalProvider] Async health check failed: %s", e)
             return False
 
+    def _default_headers(self) -> Dict[str, str]:
+        """세션과 AsyncClient에 API 키 헤더 설정"""
+        return {"X-API-Key": self.api_key}
+
     def _convert_to_external_format(
         self, request_data: WeatherForecastRequestSchema
-    ) -> dict:
+    ) -> bytes:
         """
-        내부 스키마를 외부 API 형식으로 변환
+        내부 스키마를 외부 API 형식(JSON 바이트)으로 변환
 
+        같은 (도시, 기간, 옵션) 조합은 인코딩된 바이트를 재사용
         실제 외부 API 스펙에 맞춰 수정 필요
         """
-        return {
-            "query": {
-                "city": request_data.location.city,
-                "country": request_data.location.country_code,
-            },
-            "period": {
-                "from": request_data.date_range.start,
-                "to": request_data.date_range.end,
-            },
-            "settings": {
-                "hourly": request_data.options.include_hourly == "Y",
-                "unit_system": request_data.options.units,
-            },
-        }
-
-    def _convert_from_external_format(self, external_response: dict) -> WeatherAPIResponseSchema:
+        return _encode_external_body(
+            request_data.location.city,
+            request_data.location.country_code,
+            request_data.date_range.start,
+            request_data.date_range.end,
+            request_data.options.include_hourly == "Y",
+            request_data.options.units,
+        )
+
+    def _convert_from_external_format(self, external_response: bytes) -> WeatherAPIResponseSchema:
         """
         외부 API 응답을 내부 스키마로 변환
 
+        응답 본문(bytes)을 중간 dict 없이 바로 검증
         실제 외부 API 스펙에 맞춰 수정 필요
         """
         # 외부 API 응답 형식을 내부 형식으로 변환
         # 여기서는 동일한 형식이라고 가정
-        return WeatherAPIResponseSchema(**external_response)
+        return WeatherAPIResponseSchema.model_validate_json(external_response)
+
+
+@lru_cache(maxsize=256)
+def _encode_external_body(
+    city: str, country: str, start: str, end: str, hourly: bool, unit_system: str
+) -> bytes:
+    """외부 API 요청 바디 JSON 인코딩 (인자 조합별로 메모이즈)"""
+    return to_json(
+        {
+            "query": {
+                "city": city,
+                "country": country,
+            },
+            "period": {
+                "from": start,
+                "to": end,
+            },
+            "settings": {
+                "hourly": hourly,
+                "unit_system": unit_system,
+            },
+        }
+    )
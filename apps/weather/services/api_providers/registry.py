@@ -0,0 +1,41 @@
+# apps/weather/services/api_providers/registry.py
+"""
+기본 API Provider 레지스트리
+
+Provider는 HTTP 세션/커넥션 풀을 보유하므로 프로세스당 한 번만 생성하여
+APIRouter 등 여러 사용처에서 같은 인스턴스를 공유
+"""
+
+import threading
+from typing import List, Optional
+from django.conf import settings
+
+from .base import IWeatherAPIProvider
+from .scraping_provider import ScrapingWeatherProvider
+from .external_provider import ExternalWeatherProvider
+
+# 전역 인스턴스 (싱글톤 패턴)
+_default_providers: Optional[List[IWeatherAPIProvider]] = None
+_default_providers_lock = threading.Lock()
+
+
+def get_default_providers() -> List[IWeatherAPIProvider]:
+    """
+    기본 Provider 리스트 반환 (최초 호출 시 생성)
+
+    Returns:
+        List[IWeatherAPIProvider]: 우선순위 순서의 Provider 리스트
+    """
+    global _default_providers
+
+    # 멀티스레드 워커에서 커넥션 풀이 중복 생성되지 않도록 최초 생성 시에만 락 사용
+    if _default_providers is None:
+        with _default_providers_lock:
+            if _default_providers is None:
+                api_key = getattr(settings, "WEATHER_API_KEY", "default-api-key")
+                _default_providers = [
+                    ScrapingWeatherProvider(api_key=api_key),
+                    ExternalWeatherProvider(api_key=api_key),
+                ]
+
+    return list(_default_providers)
@@ -8,8 +8,15 @@
 - 안정성: 상대적으로 낮음
 """
 
+import httpx
 import requests
 import logging
+from pydantic_core import to_json
+from apps.weather.services.api_providers.base import (
+    HEALTH_CHECK_TIMEOUT,
+    BaseHTTPWeatherProvider,
+    cached_health_check,
+)
 from apps.weather.services.weather_api.schemas import (
     WeatherForecastRequestSchema,
     WeatherForecastResponseSchema,
@@ -18,31 +25,26 @@ from apps.weather.services.weather_api.schemas import (
 
 logger = logging.getLogger(__name__)
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
-class ScrapingWeatherProvider:
+class ScrapingWeatherProvider(BaseHTTPWeatherProvider):
     """
     스크래핑 기반 날씨 API Provider
 
     기존 WeatherAPIHelper를 Provider 인터페이스로 래핑
     """
 
-    def __init__(self, api_key: str, timeout: int = 10):
-        """
-        Args:
-            api_key: API 키
-            timeout: 요청 타임아웃 (초)
-        """
-        self.api_key = api_key
-        self.base_url = "https://api.weather-service.com"
-        self.timeout = timeout
+    __slots__ = ()
+
+    log_name = "ScrapingProvider"
 
-    @property
-    def provider_name(self) -> str:
-        return "scraping"
+    provider_name = "scraping"
+    cost_per_request = 0.0  # 무료
 
-    @property
-    def cost_per_request(self) -> float:
-        return 0.0  # 무료
+    base_url = "https://api.weather-service.com"
+    forecast_endpoint = f"{base_url}/v1/forecast"
+    health_endpoint = f"{base_url}/health"
 
     def get_weather_forecast(
         self, request_data: WeatherForecastRequestSchema
@@ -60,65 +62,129 @@ class ScrapingWeatherProvider:
             requests.RequestException: 네트워크 오류
             Exception: API 오류
         """
-        endpoint = f"{self.base_url}/v1/forecast"
+        endpoint = self.forecast_endpoint
 
         try:
-            # Pydantic 스키마를 API 바디로 변환
-            body_data = request_data.to_api_body()
+            # Pydantic 스키마를 API 바디(JSON 바이트)로 변환
+            body = to_json(request_data.to_api_body())
 
             logger.info(
-                f"[ScrapingProvider] Calling API: {endpoint} for city={request_data.location.city}"
+                "[ScrapingProvider] Calling API: %s for city=%s",
+                endpoint, request_data.location.city,
             )
 
-            response = requests.post(
-                endpoint, json=body_data, timeout=self.timeout
+            response = self.session.post(
+                endpoint, data=body, headers=JSON_HEADERS, timeout=self.timeout
             )
             response.raise_for_status()
 
             # 전체 응답을 스키마로 검증
-            api_response = WeatherAPIResponseSchema(**response.json())
-
-            # 에러 응답 처리
-            if api_response.is_error:
-                logger.error(
-                    f"[ScrapingProvider] API Error: {api_response.error_message}"
-                )
-                raise Exception(f"API Error: {api_response.error_message}")
+            api_response = WeatherAPIResponseSchema.model_validate_json(response.content)
 
-            # 성공 시 데이터만 반환
-            if api_response.data is None:
-                raise Exception("API returned success but no data")
-
-            logger.info("[ScrapingProvider] API call successful")
-            return api_response.data
+            return self._extract_data(api_response)
 
         except requests.Timeout:
             logger.error("[ScrapingProvider] Request timeout")
             raise Exception("Scraping API timeout")
         except requests.RequestException as e:
-            logger.error(f"[ScrapingProvider] Network error: {e}")
+            logger.error("[ScrapingProvider] Network error: %s", e)
+            raise Exception(f"Scraping API network error: {e}")
+        except Exception as e:
+            logger.error("[ScrapingProvider] Unexpected error: %s", e)
+            raise
+
+    async def get_weather_forecast_async(
+        self, request_data: WeatherForecastRequestSchema
+    ) -> WeatherForecastResponseSchema:
+        """
+        스크래핑 방식으로 날씨 예보 조회 (비동기)
+
+        get_weather_forecast와 동일한 동작을 httpx.AsyncClient로 수행
+
+        Args:
+            request_data: 날씨 예보 요청 데이터
+
+        Returns:
+            WeatherForecastResponseSchema: 날씨 예보 응답
+
+        Raises:
+            Exception: API 오류, 타임아웃, 네트워크 오류
+        """
+        endpoint = self.forecast_endpoint
+
+        try:
+            body = to_json(request_data.to_api_body())
+
+            logger.info(
+                "[ScrapingProvider] Calling API (async): %s for city=%s",
+                endpoint, request_data.location.city,
+            )
+
+            client = self._get_async_client()
+            response = await client.post(
+                endpoint, content=body, headers=JSON_HEADERS, timeout=self.timeout
+            )
+            response.raise_for_status()
+
+            api_response = WeatherAPIResponseSchema.model_validate_json(response.content)
+            return self._extract_data(api_response)
+
+        except httpx.TimeoutException:
+            logger.error("[ScrapingProvider] Request timeout")
+            raise Exception("Scraping API timeout")
+        except httpx.HTTPError as e:
+            logger.error("[ScrapingProvider] Network error: %s", e)
             raise Exception(f"Scraping API network error: {e}")
         except Exception as e:
-            logger.error(f"[ScrapingProvider] Unexpected error: {e}")
+            logger.error("[ScrapingProvider] Unexpected error: %s", e)
             raise
 
+    @cached_health_check
     def health_check(self) -> bool:
         """
         헬스체크: 실제 API 엔드포인트에 ping 요청
 
+        결과는 짧은 TTL 동안 캐싱되어 연속 호출 시 재요청하지 않음
+
+        Returns:
+            bool: True=정상, False=장애
+        """
+        try:
+            response = self.session.get(self.health_endpoint, timeout=HEALTH_CHECK_TIMEOUT)
+            is_healthy = response.status_code == 200
+
+            logger.info(
+                "[ScrapingProvider] Health check: %s",
+                'OK' if is_healthy else 'FAIL',
+            )
+            return is_healthy
+
+        except Exception as e:
+            logger.warning("[ScrapingProvider] Health check failed: %s", e)
+            return False
+
+    @cached_health_check
+    async def health_check_async(self) -> bool:
+        """
+        헬스체크 (비동기)
+
+        이벤트 루프별 AsyncClient를 재사용하므로 DNS 조회와 TLS 연결을
+        요청 호출과 공유
+
         Returns:
             bool: True=정상, False=장애
         """
         try:
-            health_endpoint = f"{self.base_url}/health"
-            response = requests.get(health_endpoint, timeout=5)
+            client = self._get_async_client()
+            response = await client.get(self.health_endpoint, timeout=HEALTH_CHECK_TIMEOUT)
             is_healthy = response.status_code == 200
 
             logger.info(
-                f"[ScrapingProvider] Health check: {'OK' if is_healthy else 'FAIL'}"
+                "[ScrapingProvider] Async health check: %s",
+                'OK' if is_healthy else 'FAIL',
             )
             return is_healthy
 
         except Exception as e:
-            logger.warning(f"[ScrapingProvider] Health check failed: {e}")
+            logger.warning("[ScrapingProvider] Async health check failed: %s", e)
             return False
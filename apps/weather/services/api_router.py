@@ -6,15 +6,33 @@ API 라우터 (Lazy 헬스체크 버전)
 실패한 Provider는 일정 시간 후 요청 시점에 복구 시도
 """
 
+import asyncio
+import functools
+import hashlib
+import heapq
+import itertools
 import logging
+import os
+import random
+import threading
 import time
-from typing import Dict, List, Optional
-from django.core.cache import cache
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FuturesTimeoutError,
+    as_completed,
+)
+from typing import Dict, List, Optional, Tuple
 from django.conf import settings
+from django.core.cache import cache
+from asgiref.sync import async_to_sync, sync_to_async
+from django_redis import get_redis_connection
 
-from apps.weather.services.api_providers.base import IWeatherAPIProvider
-from apps.weather.services.api_providers.scraping_provider import ScrapingWeatherProvider
-from apps.weather.services.api_providers.external_provider import ExternalWeatherProvider
+from apps.weather.services.api_providers.base import (
+    HEALTH_CHECK_TIMEOUT,
+    IWeatherAPIProvider,
+)
+from apps.weather.services.api_providers.registry import get_default_providers
 from apps.weather.services.weather_api.schemas import (
     WeatherForecastRequestSchema,
     WeatherForecastResponseSchema,
@@ -22,6 +40,134 @@ from apps.weather.services.weather_api.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# 응답에 영향을 주지 않는 캐시 쓰기(성공 기록)를 처리하는 백그라운드 스레드
+_bookkeeping_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="api-router-bookkeeping"
+)
+
+# 백그라운드 복구 헬스체크 전용 스레드
+# 헬스체크가 최대 RECOVERY_CHECK_DEADLINE_SECONDS 동안 스레드를 점유해도 성공 기록이 밀리지 않도록 분리
+_recovery_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="api-router-recovery"
+)
+
+# 동기 라우팅의 헤지 Fallback 호출을 실행하는 스레드 (Primary는 요청 스레드에서 직접 호출)
+# 요청 워커 스레드마다 헤지 1개를 동시에 실행할 수 있도록 산정
+HEDGE_CALL_WORKERS = getattr(settings, "WEATHER_REQUEST_WORKER_THREADS", 16)
+_hedge_call_executor = ThreadPoolExecutor(
+    max_workers=HEDGE_CALL_WORKERS, thread_name_prefix="api-router-hedge"
+)
+
+# 실행 중인 헤지 호출 수 (스레드 수와 같아 슬롯을 얻은 호출은 큐 대기 없이 바로 실행)
+_hedge_call_slots = threading.BoundedSemaphore(HEDGE_CALL_WORKERS)
+
+
+def _release_hedge_call_slot(future: Future):
+    """헤지 호출이 끝나면(취소 포함) 실행 슬롯 반환"""
+    _hedge_call_slots.release()
+
+
+class _HedgeTimer:
+    """
+    지연 후 콜백을 실행하는 공용 타이머
+
+    요청마다 타이머 스레드를 만들지 않도록 하나의 스레드에서 순서대로 실행하므로
+    짧은 작업(헤지 호출 제출)만 등록
+    """
+
+    def __init__(self):
+        self._queue = []  # (실행 시각, 등록 순번, 콜백) 힙
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def call_later(self, delay: float, callback):
+        """
+        delay초 후 타이머 스레드에서 callback 실행
+
+        Args:
+            delay: 지연 시간 (초)
+            callback: 인자 없는 콜백
+        """
+        with self._condition:
+            heapq.heappush(
+                self._queue, (time.monotonic() + delay, next(self._counter), callback)
+            )
+            # fork된 워커에는 부모의 타이머 스레드가 없으므로 처음 사용할 때 시작
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="api-router-hedge-timer", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue or self._queue[0][0] > time.monotonic():
+                    timeout = (
+                        self._queue[0][0] - time.monotonic() if self._queue else None
+                    )
+                    self._condition.wait(timeout)
+                _, _, callback = heapq.heappop(self._queue)
+
+            try:
+                callback()
+            except Exception as e:
+                logger.warning("[APIRouter] Hedge timer callback failed: %s", e)
+
+
+_hedge_timer = _HedgeTimer()
+
+
+class _PendingHedge:
+    """
+    Primary 호출 중 예약된 헤지 Fallback 호출
+
+    Primary가 먼저 끝나 close()된 뒤에는 헤지 호출을 제출하지 않음
+    """
+
+    __slots__ = ("provider_name", "future", "_closed", "_lock")
+
+    def __init__(self, provider_name: str):
+        self.provider_name = provider_name
+        self.future: Optional[Future] = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def start(self, submit):
+        """
+        아직 close()되지 않았으면 헤지 호출 제출 (타이머 스레드에서 호출)
+
+        Args:
+            submit: 헤지 호출 Future를 반환하는 함수 (빈 슬롯이 없으면 None)
+        """
+        with self._lock:
+            if not self._closed:
+                self.future = submit()
+
+    def close(self) -> Optional[Future]:
+        """
+        이후 헤지 제출을 막고 이미 제출된 호출 반환
+
+        Returns:
+            Optional[Future]: 제출된 헤지 호출 (제출 전이었거나 생략했으면 None)
+        """
+        with self._lock:
+            self._closed = True
+            return self.future
+
+
+def _offload(func):
+    """
+    동기 캐시(Redis) 작업을 이벤트 루프 밖 스레드에서 실행하는 코루틴 함수로 변환
+
+    비동기 경로에서 Redis 왕복 동안 다른 코루틴이 멈추지 않도록 사용
+    get_many/파이프라인 한 번의 왕복을 유지하기 위해 cache.aget_many 대신 사용
+    (django-redis는 네이티브 async가 없어 aget_many가 키마다 따로 조회)
+    """
+    return sync_to_async(func, thread_sensitive=False)
+
 
 class APIRouter:
     """
@@ -34,30 +180,56 @@ class APIRouter:
     4. 실패 시점 기록 및 Lazy 복구
     """
 
+    __slots__ = (
+        "providers",
+        "provider_map",
+        "_names_by_cost",
+        "_fallback_chain",
+        "_failed_keys",
+        "_local_routing_state",
+        "_retry_jitter_key",
+        "_recovery_in_flight",
+        "_recovery_in_flight_lock",
+    )
+
     # Redis 키
     ROUTING_KEY = "routing:current"  # 현재 선택된 Provider (글로벌)
     FAILED_KEY_PREFIX = "api:failed"  # 마지막 실패 타임스탬프
     METRICS_KEY_PREFIX = "api:metrics"
+    FORECAST_KEY_PREFIX = "api:forecast"  # 요청별 예보 응답
+    LAST_GOOD_KEY_PREFIX = "api:last_good"  # 요청별 마지막 정상 응답 (장애 시 제공)
+    RECOVERY_LOCK_KEY_PREFIX = "api:recovery_lock"  # 복구 헬스체크 실행권
 
     # 캐시 TTL
     ROUTING_CACHE_TTL = 3600  # 1시간
     FAILED_CACHE_TTL = 3600  # 1시간
+    FORECAST_CACHE_TTL = 600  # 10분
+    LAST_GOOD_CACHE_TTL = 3600  # 1시간
+    METRICS_CACHE_TTL = 3600  # 1시간
+    LOCAL_ROUTING_CACHE_TTL = 1  # 1초 (프로세스 로컬 라우팅 상태)
+    TTL_JITTER_RATIO = 0.15  # TTL ±15% 랜덤 편차 (동시 만료 방지)
 
     # 재시도 간격 (초)
     RETRY_INTERVAL_SECONDS = 60  # 1분
+    RETRY_JITTER_SECONDS = 10  # 재시도 간격에 더하는 최대 랜덤 지연
+
+    # 복구 헬스체크 전체 제한 시간 (초, 재시도 없는 Provider 헬스체크 타임아웃과 동일)
+    RECOVERY_CHECK_DEADLINE_SECONDS = HEALTH_CHECK_TIMEOUT
+
+    # 복구 헬스체크 락 유지 시간 (초): 이 시간 동안 다른 워커는 같은 Provider를 헬스체크하지 않음
+    RECOVERY_LOCK_TTL = 10
+
+    # 헤지 요청 지연 (초): Primary가 응답하지 않으면 Fallback 동시 호출
+    HEDGE_DELAY_SECONDS = 0.5
 
     def __init__(self, providers: Optional[List[IWeatherAPIProvider]] = None):
         """
         Args:
-            providers: API Provider 리스트 (기본값: 자동 생성)
+            providers: API Provider 리스트 (기본값: 프로세스 공용 기본 Provider)
         """
         if providers is None:
-            # 기본 Provider 생성
-            api_key = getattr(settings, "WEATHER_API_KEY", "default-api-key")
-            self.providers = [
-                ScrapingWeatherProvider(api_key=api_key),
-                ExternalWeatherProvider(api_key=api_key),
-            ]
+            # 프로세스 공용 기본 Provider 사용 (세션/커넥션 풀 공유)
+            self.providers = get_default_providers()
         else:
             self.providers = providers
 
@@ -66,8 +238,41 @@ class APIRouter:
             provider.provider_name: provider for provider in self.providers
         }
 
+        # 비용 오름차순 Provider 이름 (같은 비용이면 등록 순서 유지)
+        self._names_by_cost: Tuple[str, ...] = tuple(
+            sorted(
+                self.provider_map,
+                key=lambda name: self.provider_map[name].cost_per_request,
+            )
+        )
+
+        # Provider별 호출 순서 (Primary, 비용 오름차순 Fallback...) 미리 계산
+        self._fallback_chain: Dict[str, Tuple[IWeatherAPIProvider, ...]] = {
+            name: (provider,)
+            + tuple(self.provider_map[n] for n in self._names_by_cost if n != name)
+            for name, provider in self.provider_map.items()
+        }
+
+        # Provider별 실패 타임스탬프 키 (일괄 조회용)
+        self._failed_keys: Dict[str, str] = {
+            name: f"{self.FAILED_KEY_PREFIX}:{name}" for name in self.provider_map
+        }
+
+        # 프로세스 로컬 라우팅 상태: (만료 시각, 할당된 Provider, 실패 타임스탬프)
+        self._local_routing_state: Optional[
+            Tuple[float, Optional[str], Dict[str, Optional[int]]]
+        ] = None
+
+        # 재시도 지연 계산용 프로세스별 키 (같은 실패에는 항상 같은 지연, 워커마다 다른 지연)
+        self._retry_jitter_key = os.urandom(16)
+
+        # 이 프로세스에서 백그라운드 복구가 예약/실행 중인 Provider (중복 제출 방지)
+        self._recovery_in_flight = set()
+        self._recovery_in_flight_lock = threading.Lock()
+
         logger.info(
-            f"[APIRouter] Initialized with providers: {list(self.provider_map.keys())}"
+            "[APIRouter] Initialized with providers: %s",
+            list(self.provider_map.keys()),
         )
 
     def route_request(
@@ -76,10 +281,11 @@ class APIRouter:
         """
         요청 라우팅 및 폴백 처리 (Lazy 헬스체크)
 
+        0. 동일 요청의 예보 응답 캐시 조회 (있으면 바로 반환)
         1. Redis에서 글로벌 라우팅 캐시 조회
         2. 캐시 없으면 동적 할당 (lazy 복구 시도 포함)
         3. Primary API 호출
-        4. 실패 시 Fallback API 호출
+        4. 실패 시 Fallback API 호출 (모두 실패하면 마지막 정상 응답 반환)
         5. Redis에 결과 캐싱
 
         Args:
@@ -90,316 +296,1710 @@ class APIRouter:
             WeatherForecastResponseSchema: 날씨 예보 응답
 
         Raises:
-            Exception: 모든 API 실패 시
+            Exception: 모든 API가 실패하고 마지막 정상 응답도 없을 때
         """
-        logger.info(f"[APIRouter] Routing request for user_id={user_id}")
+        logger.info("[APIRouter] Routing request for user_id=%s", user_id)
+
+        # 0. 예보 캐시, 할당된 Provider, 실패 기록을 한 번에 조회
+        request_hash = self._get_request_hash(request_data)
+        forecast_key = self._get_forecast_cache_key(request_hash)
+        cached_forecasts, cached_provider_name, failed_timestamps = (
+            self._get_routing_state([forecast_key])
+        )
+        cached_forecast = cached_forecasts.get(forecast_key)
 
-        # 1. 캐시에서 할당된 Provider 조회
-        cached_provider_name = self._get_cached_routing()
+        # 1. 동일 요청의 응답 캐시가 있으면 바로 반환
+        if cached_forecast is not None:
+            return self._load_cached_forecast(forecast_key, cached_forecast)
 
         # 2. 캐시 없으면 동적 할당 (lazy 복구 시도 포함)
+        recovery_pending = False
         if cached_provider_name is None:
-            primary_provider_name = self._select_provider(request_data)
+            primary_provider_name, recovery_pending = self._select_route(
+                request_data, failed_timestamps
+            )
             logger.info(
-                f"[APIRouter] No cache, dynamically selected: {primary_provider_name}"
+                "[APIRouter] No cache, dynamically selected: %s",
+                primary_provider_name,
             )
         else:
             primary_provider_name = cached_provider_name
-            logger.info(
-                f"[APIRouter] Cache hit: {primary_provider_name}"
-            )
+            logger.info("[APIRouter] Cache hit: %s", primary_provider_name)
 
-        # 3. Primary API 호출 및 폴백 처리
-        response = self._call_with_fallback(
-            primary_provider_name, request_data
-        )
+        # 3. Primary API 호출 및 폴백 처리 (모두 실패하면 마지막 정상 응답 제공)
+        try:
+            response = self._call_with_fallback(
+                primary_provider_name,
+                request_data,
+                primary_routed=self._is_routed_and_healthy(
+                    cached_provider_name, failed_timestamps
+                ),
+                failed_timestamps=failed_timestamps,
+                pin_routing=not recovery_pending,
+            )
+        except Exception as e:
+            return self._load_last_good_forecast(request_hash, e)
 
+        self._set_cached_forecast(request_hash, response)
         return response
 
-    def _get_cached_routing(self) -> Optional[str]:
+    async def route_request_async(
+        self, user_id: int, request_data: WeatherForecastRequestSchema
+    ) -> WeatherForecastResponseSchema:
         """
-        Redis에서 글로벌 라우팅 캐시 조회
+        요청 라우팅 및 폴백 처리 (비동기)
+
+        route_request와 동일한 흐름이지만 Provider 호출을 await하여
+        ASGI 환경에서 요청마다 스레드를 점유하지 않음
+
+        Args:
+            user_id: 사용자 ID (메트릭/로깅용)
+            request_data: 날씨 예보 요청 데이터
 
         Returns:
-            Optional[str]: Provider 이름 (없으면 None)
+            WeatherForecastResponseSchema: 날씨 예보 응답
+
+        Raises:
+            Exception: 모든 API가 실패하고 마지막 정상 응답도 없을 때
         """
-        cached_value = cache.get(self.ROUTING_KEY)
+        logger.info("[APIRouter] Routing async request for user_id=%s", user_id)
+
+        # 캐시 조회/저장은 이벤트 루프를 막지 않도록 스레드에서 실행
+        request_hash = self._get_request_hash(request_data)
+        forecast_key = self._get_forecast_cache_key(request_hash)
+        cached_forecasts, cached_provider_name, failed_timestamps = (
+            await _offload(self._get_routing_state)([forecast_key])
+        )
+        cached_forecast = cached_forecasts.get(forecast_key)
 
-        if cached_value:
-            logger.debug(f"[APIRouter] Cache hit: {cached_value}")
+        if cached_forecast is not None:
+            return self._load_cached_forecast(forecast_key, cached_forecast)
+
+        recovery_pending = False
+        if cached_provider_name is None:
+            # 동적 할당 (복구 헬스체크도 비동기로 동시 실행)
+            primary_provider_name, recovery_pending = await self._select_route_async(
+                request_data, failed_timestamps
+            )
+            logger.info(
+                "[APIRouter] No cache, dynamically selected: %s",
+                primary_provider_name,
+            )
         else:
-            logger.debug(f"[APIRouter] Cache miss")
+            primary_provider_name = cached_provider_name
+            logger.info("[APIRouter] Cache hit: %s", primary_provider_name)
+
+        try:
+            response = await self._call_with_fallback_async(
+                primary_provider_name,
+                request_data,
+                primary_routed=self._is_routed_and_healthy(
+                    cached_provider_name, failed_timestamps
+                ),
+                failed_timestamps=failed_timestamps,
+                pin_routing=not recovery_pending,
+            )
+        except Exception as e:
+            return await _offload(self._load_last_good_forecast)(request_hash, e)
 
-        return cached_value
+        await _offload(self._set_cached_forecast)(request_hash, response)
+        return response
 
-    def _set_cached_routing(self, provider_name: str):
+    def route_many(
+        self, user_id: int, requests_data: List[WeatherForecastRequestSchema]
+    ) -> List[WeatherForecastResponseSchema]:
         """
-        Redis에 글로벌 라우팅 캐시 저장
+        여러 요청을 한 번에 라우팅 (동기 호출용)
+
+        호출마다 새 이벤트 루프에서 route_many_async를 실행하고 결과를 반환
+        배치 안의 요청은 Provider별 AsyncClient 커넥션 풀을 공유하며,
+        루프가 닫히기 전에 클라이언트를 종료 (커넥션 누수 방지)
 
         Args:
-            provider_name: Provider 이름
+            user_id: 사용자 ID (메트릭/로깅용)
+            requests_data: 날씨 예보 요청 데이터 리스트
+
+        Returns:
+            List[WeatherForecastResponseSchema]: 요청 순서대로 정렬된 응답 리스트
+
+        Raises:
+            Exception: 캐시에 없는 요청 중 하나라도 모든 API가 실패하고
+                마지막 정상 응답도 없는 경우
         """
-        cache.set(self.ROUTING_KEY, provider_name, self.ROUTING_CACHE_TTL)
-        logger.debug(
-            f"[APIRouter] Cached routing: {provider_name}"
+        # 새 루프를 강제해야 종료한 클라이언트가 다른 요청과 공유되지 않음
+        return async_to_sync(self._route_many_scoped, force_new_loop=True)(
+            user_id, requests_data
         )
 
-    def _select_provider(self, request_data: WeatherForecastRequestSchema) -> str:
+    async def _route_many_scoped(
+        self, user_id: int, requests_data: List[WeatherForecastRequestSchema]
+    ) -> List[WeatherForecastResponseSchema]:
         """
-        동적 Provider 선택 (Lazy 헬스체크 포함)
-
-        실패한 Provider는 재시도 간격이 지났으면 복구 시도
+        route_many_async 실행 후 이 이벤트 루프의 AsyncClient 종료
 
         Args:
-            request_data: 요청 데이터 (복구 시도용)
+            user_id: 사용자 ID (메트릭/로깅용)
+            requests_data: 날씨 예보 요청 데이터 리스트
 
         Returns:
-            str: 선택된 Provider 이름
+            List[WeatherForecastResponseSchema]: 요청 순서대로 정렬된 응답 리스트
         """
-        available_providers = []
-
-        for provider_name in self.provider_map.keys():
-            # 재시도 가능한지 확인
-            if self._should_retry_provider(provider_name):
-                # Lazy 복구 시도
-                logger.info(f"[APIRouter] Attempting lazy recovery for {provider_name}")
-                recovered = self._try_recovery(provider_name, request_data)
-
-                if recovered:
-                    logger.info(f"[APIRouter] {provider_name} recovered!")
-                    available_providers.append(provider_name)
-                else:
-                    logger.warning(f"[APIRouter] {provider_name} still unhealthy")
-            elif not self._is_provider_failed(provider_name):
-                # 실패 기록이 없으면 사용 가능
-                available_providers.append(provider_name)
-
-        if not available_providers:
-            # 모두 실패 상태면 기본값 사용 (scraping)
-            logger.warning("[APIRouter] No available providers, using default: scraping")
-            return "scraping"
-
-        # 비용 기반 선택: 무료 Provider 우선 (scraping)
-        if "scraping" in available_providers:
-            logger.info("[APIRouter] Selected scraping provider (free)")
-            return "scraping"
-        else:
-            # scraping이 없으면 다른 Provider 사용
-            selected = available_providers[0]
-            logger.info(f"[APIRouter] Selected {selected} provider")
-            return selected
-
-    def _should_retry_provider(self, provider_name: str) -> bool:
+        try:
+            return await self.route_many_async(user_id, requests_data)
+        finally:
+            await self._close_async_clients()
+
+    async def _close_async_clients(self):
+        """현재 이벤트 루프에서 Provider가 사용한 AsyncClient 종료 (실패는 로그만 남김)"""
+        results = await asyncio.gather(
+            *(provider.aclose_async_client() for provider in self.providers),
+            return_exceptions=True,
+        )
+        for provider, result in zip(self.providers, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "[APIRouter] Failed to close async client for %s: %s",
+                    provider.provider_name, result,
+                )
+
+    async def route_many_async(
+        self, user_id: int, requests_data: List[WeatherForecastRequestSchema]
+    ) -> List[WeatherForecastResponseSchema]:
         """
-        Provider가 재시도 가능한지 확인
+        여러 요청을 한 번에 라우팅 (비동기)
 
-        실패한 지 RETRY_INTERVAL_SECONDS 이상 경과했는지 확인
+        예보 캐시, 라우팅 캐시, 실패 기록을 한 번에 조회하고
+        캐시에 없는 요청만 같은 Provider로 동시에 호출
+        동일한 요청이 여러 번 포함되면 한 번만 호출
 
         Args:
-            provider_name: Provider 이름
+            user_id: 사용자 ID (메트릭/로깅용)
+            requests_data: 날씨 예보 요청 데이터 리스트
 
         Returns:
-            bool: True=재시도 가능, False=아직 대기 중
+            List[WeatherForecastResponseSchema]: 요청 순서대로 정렬된 응답 리스트
+
+        Raises:
+            Exception: 캐시에 없는 요청 중 하나라도 모든 API가 실패하고
+                마지막 정상 응답도 없는 경우
         """
-        last_failed_at = self._get_last_failed_timestamp(provider_name)
+        logger.info(
+            "[APIRouter] Routing %s requests for user_id=%s",
+            len(requests_data), user_id,
+        )
 
-        if last_failed_at is None:
-            # 실패 기록 없음
-            return False
+        # 요청 해시는 요청마다 한 번만 계산 (동일 요청은 같은 해시로 중복 제거)
+        request_hashes = [self._get_request_hash(r) for r in requests_data]
+        forecast_keys = {h: self._get_forecast_cache_key(h) for h in request_hashes}
+        cached_forecasts, cached_provider_name, failed_timestamps = (
+            await _offload(self._get_routing_state)(list(forecast_keys.values()))
+        )
 
-        elapsed = time.time() - last_failed_at
+        responses: Dict[str, WeatherForecastResponseSchema] = {
+            request_hash: self._load_cached_forecast(key, cached_forecasts[key])
+            for request_hash, key in forecast_keys.items()
+            if key in cached_forecasts
+        }
 
-        if elapsed >= self.RETRY_INTERVAL_SECONDS:
-            logger.debug(
-                f"[APIRouter] {provider_name} retry interval elapsed ({elapsed:.1f}s)"
+        # 캐시에 없는 요청 (요청 해시 기준 중복 제거)
+        missing: Dict[str, WeatherForecastRequestSchema] = {}
+        for request_hash, request_data in zip(request_hashes, requests_data):
+            if request_hash not in responses:
+                missing.setdefault(request_hash, request_data)
+
+        if missing:
+            recovery_pending = False
+            if cached_provider_name is None:
+                primary_provider_name, recovery_pending = (
+                    await self._select_route_async(
+                        next(iter(missing.values())), failed_timestamps
+                    )
+                )
+            else:
+                primary_provider_name = cached_provider_name
+            primary_routed = self._is_routed_and_healthy(
+                cached_provider_name, failed_timestamps
             )
-            return True
-        else:
-            logger.debug(
-                f"[APIRouter] {provider_name} still in cooldown ({elapsed:.1f}s / {self.RETRY_INTERVAL_SECONDS}s)"
+
+            results = await asyncio.gather(
+                *(
+                    self._call_with_fallback_async(
+                        primary_provider_name,
+                        request_data,
+                        primary_routed=primary_routed,
+                        failed_timestamps=failed_timestamps,
+                        pin_routing=not recovery_pending,
+                    )
+                    for request_data in missing.values()
+                ),
+                return_exceptions=True,
             )
-            return False
 
-    def _try_recovery(self, provider_name: str, request_data: WeatherForecastRequestSchema) -> bool:
+            fetched: Dict[str, WeatherForecastResponseSchema] = {}
+            for request_hash, result in zip(missing, results):
+                if isinstance(result, Exception):
+                    # 모든 API가 실패한 요청은 마지막 정상 응답으로 대체 (캐시하지 않음)
+                    responses[request_hash] = await _offload(
+                        self._load_last_good_forecast
+                    )(request_hash, result)
+                else:
+                    fetched[request_hash] = result
+
+            await _offload(self._set_cached_forecasts)(fetched)
+            responses.update(fetched)
+
+        return [responses[request_hash] for request_hash in request_hashes]
+
+    def get_health_summary(self) -> Dict:
         """
-        Provider 복구 시도 (헬스체크)
+        Provider 상태 요약 (헬스체크 엔드포인트 본문용)
 
-        Args:
-            provider_name: Provider 이름
-            request_data: 요청 데이터 (실제 호출 대신 헬스체크)
+        실패 타임스탬프만 한 번에 조회하며 실제 헬스체크 호출은 하지 않음
+        실패 기록은 모든 Pod가 공유하므로 Pod 준비 상태(readiness) 판단에는 사용하지 않음
 
         Returns:
-            bool: True=복구 성공, False=여전히 실패
+            Dict: {"status": "healthy" | "unhealthy", "providers": {이름: 상태}}
+                하나 이상의 Provider가 정상이면 healthy
         """
-        provider = self.provider_map.get(provider_name)
-        if provider is None:
-            return False
-
-        try:
-            # 헬스체크 시도
-            is_healthy = provider.health_check()
+        failed_timestamps = self._get_failed_timestamps()
 
-            if is_healthy:
-                # 복구 성공: 실패 기록 삭제
-                self._clear_failed_timestamp(provider_name)
-                logger.info(f"[APIRouter] {provider_name} recovery successful")
-                return True
-            else:
-                # 여전히 실패: 타임스탬프 갱신
-                self._mark_provider_failed(provider_name)
-                logger.warning(f"[APIRouter] {provider_name} recovery failed")
-                return False
+        providers = {
+            name: "unhealthy" if failed_at is not None else "healthy"
+            for name, failed_at in failed_timestamps.items()
+        }
+        status = "healthy" if "healthy" in providers.values() else "unhealthy"
 
-        except Exception as e:
-            # 헬스체크 실패: 타임스탬프 갱신
-            self._mark_provider_failed(provider_name)
-            logger.error(f"[APIRouter] {provider_name} recovery exception: {e}")
-            return False
+        return {"status": status, "providers": providers}
 
-    def _is_provider_failed(self, provider_name: str) -> bool:
+    def _get_request_hash(self, request_data: WeatherForecastRequestSchema) -> str:
         """
-        Provider가 실패 상태인지 확인
+        요청 데이터 해시 생성 (요청당 한 번만 계산해 캐시 키에 재사용)
+
+        동일한 요청(도시, 기간, 옵션)은 항상 같은 해시가 되도록 요청 JSON을 해싱
 
         Args:
-            provider_name: Provider 이름
+            request_data: 날씨 예보 요청 데이터
 
         Returns:
-            bool: True=실패 상태, False=정상
+            str: 요청 해시 (hex)
         """
-        return self._get_last_failed_timestamp(provider_name) is not None
+        return hashlib.blake2b(
+            request_data.model_dump_json().encode(), digest_size=16
+        ).hexdigest()
 
-    def _get_last_failed_timestamp(self, provider_name: str) -> Optional[float]:
+    def _get_forecast_cache_key(self, request_hash: str) -> str:
         """
-        마지막 실패 타임스탬프 조회
+        요청 해시로 예보 응답 캐시 키 생성
 
         Args:
-            provider_name: Provider 이름
+            request_hash: _get_request_hash로 계산한 요청 해시
 
         Returns:
-            Optional[float]: Unix timestamp (없으면 None)
+            str: 캐시 키
         """
-        cache_key = f"{self.FAILED_KEY_PREFIX}:{provider_name}"
-        timestamp = cache.get(cache_key)
-        return float(timestamp) if timestamp is not None else None
+        return f"{self.FORECAST_KEY_PREFIX}:{request_hash}"
 
-    def _mark_provider_failed(self, provider_name: str):
+    def _get_routing_state(
+        self, forecast_keys: List[str]
+    ) -> Tuple[Dict[str, str], Optional[str], Dict[str, Optional[int]]]:
         """
-        Provider를 실패 상태로 마킹 (타임스탬프 저장)
+        라우팅에 필요한 캐시 값을 한 번의 조회(MGET)로 가져오기
+
+        라우팅 상태(할당된 Provider, 실패 타임스탬프)는 LOCAL_ROUTING_CACHE_TTL 동안
+        프로세스 메모리에 보관하며, 그동안은 예보 캐시 키만 Redis에서 조회
 
         Args:
-            provider_name: Provider 이름
+            forecast_keys: 예보 캐시 키 리스트
+
+        Returns:
+            Tuple: (캐시 키별 예보 JSON, 할당된 Provider 이름, Provider별 마지막 실패 시각)
         """
-        cache_key = f"{self.FAILED_KEY_PREFIX}:{provider_name}"
-        cache.set(cache_key, time.time(), timeout=self.FAILED_CACHE_TTL)
-        logger.info(f"[APIRouter] Marked {provider_name} as failed")
+        now = time.monotonic()
+        local_state = self._local_routing_state
+        if local_state is not None and local_state[0] > now:
+            _, cached_provider_name, failed_timestamps = local_state
+            logger.debug("[APIRouter] Local routing hit: %s", cached_provider_name)
+            # 요청 중 수정되므로 복사본 전달
+            return (
+                cache.get_many(forecast_keys),
+                cached_provider_name,
+                dict(failed_timestamps),
+            )
 
-    def _clear_failed_timestamp(self, provider_name: str):
+        values = cache.get_many(
+            [*forecast_keys, self.ROUTING_KEY, *self._failed_keys.values()]
+        )
+        failed_timestamps = self._parse_failed_timestamps(values)
+
+        cached_provider_name = values.get(self.ROUTING_KEY)
+        if cached_provider_name in self.provider_map:
+            logger.debug("[APIRouter] Cache hit: %s", cached_provider_name)
+        else:
+            # 등록되지 않은 Provider(설정 변경 등)가 캐시되어 있으면 미스로 처리
+            cached_provider_name = None
+            logger.debug("[APIRouter] Cache miss")
+
+        self._local_routing_state = (
+            now + self.LOCAL_ROUTING_CACHE_TTL,
+            cached_provider_name,
+            dict(failed_timestamps),
+        )
+
+        cached_forecasts = {
+            key: values[key] for key in forecast_keys if key in values
+        }
+        return cached_forecasts, cached_provider_name, failed_timestamps
+
+    def _invalidate_local_routing(self):
+        """프로세스 로컬 라우팅 상태 무효화 (라우팅/실패 기록 변경 시)"""
+        self._local_routing_state = None
+
+    def _is_routed_and_healthy(
+        self,
+        cached_provider_name: Optional[str],
+        failed_timestamps: Dict[str, Optional[int]],
+    ) -> bool:
         """
-        Provider 실패 기록 삭제 (복구 완료)
+        캐시된 Provider가 실패 기록 없이 그대로 사용 가능한지 확인
+
+        True이면 호출 성공 시 라우팅 캐시 저장과 실패 기록 삭제를 생략 가능
 
         Args:
-            provider_name: Provider 이름
+            cached_provider_name: 라우팅 캐시의 Provider 이름
+            failed_timestamps: 미리 조회한 실패 타임스탬프
+
+        Returns:
+            bool: True=라우팅 캐시 히트이고 실패 기록 없음
         """
-        cache_key = f"{self.FAILED_KEY_PREFIX}:{provider_name}"
-        cache.delete(cache_key)
-        logger.info(f"[APIRouter] Cleared failed status for {provider_name}")
+        return (
+            cached_provider_name is not None
+            and failed_timestamps.get(cached_provider_name) is None
+        )
 
-    def _call_with_fallback(
-        self,
-        primary_provider_name: str,
-        request_data: WeatherForecastRequestSchema,
+    def _get_failed_timestamps(self) -> Dict[str, Optional[int]]:
+        """
+        모든 Provider의 마지막 실패 타임스탬프를 한 번에 조회
+
+        Returns:
+            Dict[str, Optional[int]]: Provider 이름별 실패 시각 (없으면 None)
+        """
+        values = cache.get_many(list(self._failed_keys.values()))
+        return self._parse_failed_timestamps(values)
+
+    def _parse_failed_timestamps(self, values: Dict) -> Dict[str, Optional[int]]:
+        """
+        get_many 결과에서 Provider별 실패 타임스탬프 추출
+
+        Args:
+            values: cache.get_many 결과 (캐시 키 -> 값)
+
+        Returns:
+            Dict[str, Optional[int]]: Provider 이름별 실패 시각 (없으면 None)
+        """
+        failed_timestamps = {}
+        for name, key in self._failed_keys.items():
+            timestamp = values.get(key)
+            failed_timestamps[name] = int(timestamp) if timestamp is not None else None
+        return failed_timestamps
+
+    def _load_cached_forecast(
+        self, cache_key: str, cached_value: str
     ) -> WeatherForecastResponseSchema:
         """
-        Primary API 호출 및 실패 시 폴백 처리
+        캐시된 예보 응답 역직렬화
 
         Args:
-            primary_provider_name: Primary Provider 이름
-            request_data: 요청 데이터
+            cache_key: 예보 캐시 키 (로깅용)
+            cached_value: 캐시된 예보 JSON
 
         Returns:
-            WeatherForecastResponseSchema: 응답
+            WeatherForecastResponseSchema: 캐시된 응답
+        """
+        logger.debug("[APIRouter] Forecast cache hit: %s", cache_key)
+        return WeatherForecastResponseSchema.model_validate_json(cached_value)
 
-        Raises:
-            Exception: 모든 API 실패 시
+    def _set_cached_forecast(
+        self, request_hash: str, response: WeatherForecastResponseSchema
+    ):
         """
-        # Primary Provider 시도
-        primary_provider = self.provider_map.get(primary_provider_name)
-        if primary_provider is None:
-            raise Exception(f"Provider not found: {primary_provider_name}")
+        예보 응답 캐시 저장
 
-        try:
-            logger.info(f"[APIRouter] Calling primary provider: {primary_provider_name}")
-            response = primary_provider.get_weather_forecast(request_data)
+        Args:
+            request_hash: 요청 해시
+            response: 예보 응답
+        """
+        self._set_cached_forecasts({request_hash: response})
 
-            # 성공 시: 캐시 저장 & 실패 기록 삭제 (복구)
-            self._set_cached_routing(primary_provider_name)
-            self._increment_success_metric(primary_provider_name)
-            self._clear_failed_timestamp(primary_provider_name)
+    def _set_cached_forecasts(
+        self, responses: Dict[str, WeatherForecastResponseSchema]
+    ):
+        """
+        예보 응답 캐시와 마지막 정상 응답 캐시를 함께 저장 (write-through)
 
-            return response
+        Redis 백엔드면 두 캐시 쓰기를 한 번의 왕복으로 전송
 
-        except Exception as e:
-            logger.error(
-                f"[APIRouter] Primary provider failed: {primary_provider_name}, error: {e}"
-            )
-            self._increment_failure_metric(primary_provider_name)
-            self._mark_provider_failed(primary_provider_name)
+        Args:
+            responses: 요청 해시별 예보 응답
+        """
+        if not responses:
+            return
+
+        forecasts = {}
+        last_goods = {}
+        for request_hash, response in responses.items():
+            value = response.model_dump_json()
+            forecasts[self._get_forecast_cache_key(request_hash)] = value
+            last_goods[self._get_last_good_cache_key(request_hash)] = value
+
+        pipeline = self._get_redis_pipeline()
+        if pipeline is None:
+            cache.set_many(forecasts, self.FORECAST_CACHE_TTL)
+            cache.set_many(last_goods, self.LAST_GOOD_CACHE_TTL)
+            return
+
+        # cache.get_many()와 호환되도록 django-redis 직렬화 형식으로 저장
+        for values, ttl in (
+            (forecasts, self.FORECAST_CACHE_TTL),
+            (last_goods, self.LAST_GOOD_CACHE_TTL),
+        ):
+            for key, value in values.items():
+                pipeline.set(cache.make_key(key), cache.client.encode(value), ex=ttl)
+        pipeline.execute()
+
+    def _get_last_good_cache_key(self, request_hash: str) -> str:
+        """
+        요청 해시로 마지막 정상 응답 캐시 키 생성
 
-            # Fallback Provider 선택 (primary가 아닌 다른 Provider)
-            fallback_providers = [
-                name for name in self.provider_map.keys() if name != primary_provider_name
-            ]
+        Args:
+            request_hash: 요청 해시
 
-            if not fallback_providers:
-                raise Exception(f"No fallback provider available, primary failed: {e}")
+        Returns:
+            str: 마지막 정상 응답 캐시 키
+        """
+        return f"{self.LAST_GOOD_KEY_PREFIX}:{request_hash}"
 
-            # Fallback Provider 시도
-            for fallback_name in fallback_providers:
-                try:
-                    logger.info(f"[APIRouter] Trying fallback provider: {fallback_name}")
-                    fallback_provider = self.provider_map[fallback_name]
-                    response = fallback_provider.get_weather_forecast(request_data)
+    def _load_last_good_forecast(
+        self, request_hash: str, error: Exception
+    ) -> WeatherForecastResponseSchema:
+        """
+        모든 API 실패 시 마지막 정상 응답 반환 (stale-if-error)
 
-                    # Fallback 성공 시: 캐시 업데이트 & 실패 기록 삭제
-                    self._set_cached_routing(fallback_name)
-                    self._increment_success_metric(fallback_name)
-                    self._clear_failed_timestamp(fallback_name)
+        Args:
+            request_hash: 요청 해시
+            error: 모든 API 실패 시 발생한 예외
 
-                    logger.info(
-                        f"[APIRouter] Fallback successful: {fallback_name}"
-                    )
-                    return response
+        Returns:
+            WeatherForecastResponseSchema: 마지막 정상 응답
 
-                except Exception as fallback_error:
-                    logger.error(
-                        f"[APIRouter] Fallback provider failed: {fallback_name}, error: {fallback_error}"
-                    )
-                    self._increment_failure_metric(fallback_name)
-                    self._mark_provider_failed(fallback_name)
-                    continue
+        Raises:
+            Exception: 마지막 정상 응답이 없으면 원래 예외를 그대로 발생
+        """
+        cached_value = cache.get(self._get_last_good_cache_key(request_hash))
+        if cached_value is None:
+            raise error
 
-            # 모든 Provider 실패
-            raise Exception("All providers failed")
+        logger.warning(
+            "[APIRouter] All providers failed, serving last known good response: %s (%s)",
+            request_hash, error,
+        )
+        return WeatherForecastResponseSchema.model_validate_json(cached_value)
 
-    def _increment_success_metric(self, provider_name: str):
-        """성공 메트릭 증가"""
-        cache_key = f"{self.METRICS_KEY_PREFIX}:{provider_name}:success"
-        try:
-            cache.incr(cache_key)
-        except ValueError:
-            cache.set(cache_key, 1, timeout=3600)  # 1시간 TTL
+    def _set_cached_routing(self, provider_name: str):
+        """
+        Redis에 글로벌 라우팅 캐시 저장
 
-    def _increment_failure_metric(self, provider_name: str):
-        """실패 메트릭 증가"""
-        cache_key = f"{self.METRICS_KEY_PREFIX}:{provider_name}:failure"
-        try:
-            cache.incr(cache_key)
-        except ValueError:
-            cache.set(cache_key, 1, timeout=3600)  # 1시간 TTL
+        Args:
+            provider_name: Provider 이름
+        """
+        cache.set(
+            self.ROUTING_KEY, provider_name, self._jittered(self.ROUTING_CACHE_TTL)
+        )
+        self._invalidate_local_routing()
+        logger.debug("[APIRouter] Cached routing: %s", provider_name)
+
+    def _select_provider(
+        self,
+        request_data: WeatherForecastRequestSchema,
+        failed_timestamps: Optional[Dict[str, Optional[int]]] = None,
+    ) -> str:
+        """
+        동적 Provider 선택 (Lazy 헬스체크 포함, 상세는 _select_route 참고)
+
+        Args:
+            request_data: 요청 데이터 (복구 시도용)
+            failed_timestamps: 미리 조회한 실패 타임스탬프 (없으면 조회)
+
+        Returns:
+            str: 선택된 Provider 이름
+        """
+        return self._select_route(request_data, failed_timestamps)[0]
+
+    def _select_route(
+        self,
+        request_data: WeatherForecastRequestSchema,
+        failed_timestamps: Optional[Dict[str, Optional[int]]] = None,
+    ) -> Tuple[str, bool]:
+        """
+        동적 Provider 선택 및 백그라운드 복구 여부 반환
+
+        사용 가능한 Provider가 있으면 바로 반환하고, 그보다 싼 실패 Provider의
+        복구 헬스체크는 백그라운드로 실행 (결과는 다음 요청부터 반영)
+        사용 가능한 Provider가 없을 때만 복구 헬스체크를 기다림
+
+        Args:
+            request_data: 요청 데이터 (복구 시도용)
+            failed_timestamps: 미리 조회한 실패 타임스탬프 (없으면 조회)
+
+        Returns:
+            Tuple[str, bool]: (선택된 Provider 이름, 더 싼 Provider 복구가 백그라운드에서
+                진행 중인지 여부 - True면 성공해도 라우팅을 고정하지 않아야 함)
+        """
+        if failed_timestamps is None:
+            failed_timestamps = self._get_failed_timestamps()
+
+        cheapest_available, retry_candidates = self._classify_providers(
+            failed_timestamps
+        )
+
+        recovery_results = {}
+        recovery_pending = bool(retry_candidates) and cheapest_available is not None
+        if recovery_pending:
+            # 정상 Provider가 있으므로 복구 헬스체크를 요청 경로에서 제외
+            self._schedule_recovery(retry_candidates, request_data)
+        elif retry_candidates:
+            # Lazy 복구 시도 (병렬)
+            recovery_results = self._try_recovery_many(retry_candidates, request_data)
+            self._apply_recovered_state(failed_timestamps, recovery_results)
+
+        return (
+            self._choose_provider(cheapest_available, recovery_results),
+            recovery_pending,
+        )
+
+    async def _select_provider_async(
+        self,
+        request_data: WeatherForecastRequestSchema,
+        failed_timestamps: Optional[Dict[str, Optional[int]]] = None,
+    ) -> str:
+        """
+        동적 Provider 선택 (비동기, 상세는 _select_route_async 참고)
+
+        Args:
+            request_data: 요청 데이터 (복구 시도용)
+            failed_timestamps: 미리 조회한 실패 타임스탬프 (없으면 조회)
+
+        Returns:
+            str: 선택된 Provider 이름
+        """
+        return (await self._select_route_async(request_data, failed_timestamps))[0]
+
+    async def _select_route_async(
+        self,
+        request_data: WeatherForecastRequestSchema,
+        failed_timestamps: Optional[Dict[str, Optional[int]]] = None,
+    ) -> Tuple[str, bool]:
+        """
+        동적 Provider 선택 및 백그라운드 복구 여부 반환 (비동기)
+
+        _select_route와 동일하지만 기다려야 하는 복구 헬스체크(사용 가능한
+        Provider가 없을 때)는 스레드 대신 Provider의 health_check_async로 동시 실행
+
+        Args:
+            request_data: 요청 데이터 (복구 시도용)
+            failed_timestamps: 미리 조회한 실패 타임스탬프 (없으면 조회)
+
+        Returns:
+            Tuple[str, bool]: (선택된 Provider 이름, 더 싼 Provider 복구가 백그라운드에서
+                진행 중인지 여부)
+        """
+        if failed_timestamps is None:
+            failed_timestamps = await _offload(self._get_failed_timestamps)()
+
+        cheapest_available, retry_candidates = self._classify_providers(
+            failed_timestamps
+        )
+
+        recovery_results = {}
+        recovery_pending = bool(retry_candidates) and cheapest_available is not None
+        if recovery_pending:
+            self._schedule_recovery(retry_candidates, request_data)
+        elif retry_candidates:
+            recovery_results = await self._try_recovery_many_async(retry_candidates)
+            self._apply_recovered_state(failed_timestamps, recovery_results)
+
+        return (
+            self._choose_provider(cheapest_available, recovery_results),
+            recovery_pending,
+        )
+
+    def _apply_recovered_state(
+        self,
+        failed_timestamps: Dict[str, Optional[int]],
+        recovery_results: Dict[str, bool],
+    ):
+        """
+        요청 범위 실패 상태에 복구 결과 반영 (복구된 Provider는 실패 기록 없음)
+
+        Args:
+            failed_timestamps: 요청 시작 시 조회한 실패 타임스탬프 (직접 수정)
+            recovery_results: Provider 이름별 복구 성공 여부
+        """
+        for provider_name, recovered in recovery_results.items():
+            if recovered:
+                failed_timestamps[provider_name] = None
+
+    def _needs_failed_clear(
+        self,
+        provider_name: str,
+        failed_timestamps: Optional[Dict[str, Optional[int]]],
+    ) -> bool:
+        """
+        호출 성공 시 실패 기록 삭제가 필요한지 확인
+
+        Args:
+            provider_name: Provider 이름
+            failed_timestamps: 요청 범위 실패 상태 (없으면 알 수 없음)
+
+        Returns:
+            bool: True=삭제 필요 (실패 기록이 있거나 상태를 모름)
+        """
+        return (
+            failed_timestamps is None
+            or failed_timestamps.get(provider_name) is not None
+        )
+
+    def _classify_providers(
+        self, failed_timestamps: Optional[Dict[str, Optional[int]]] = None
+    ) -> Tuple[Optional[str], List[str]]:
+        """
+        비용 오름차순으로 가장 싼 사용 가능 Provider와 복구 시도 대상 분류
+
+        사용 가능한 Provider를 찾으면 즉시 중단하므로, 그보다 비싼
+        Provider는 재시도 간격이 지났어도 헬스체크하지 않음
+
+        Args:
+            failed_timestamps: 미리 조회한 실패 타임스탬프 (없으면 조회)
+
+        Returns:
+            Tuple[Optional[str], List[str]]:
+                (가장 싼 사용 가능 Provider, 그보다 싼 재시도 대상 Provider)
+        """
+        if failed_timestamps is None:
+            failed_timestamps = self._get_failed_timestamps()
+
+        retry_candidates = []
+
+        for provider_name in self._names_by_cost:
+            last_failed_at = failed_timestamps.get(provider_name)
+
+            if last_failed_at is None:
+                # 실패 기록이 없으면 사용 가능 (더 비싼 Provider는 볼 필요 없음)
+                return provider_name, retry_candidates
+
+            # 재시도 가능한지 확인
+            if self._is_retry_due(provider_name, last_failed_at):
+                logger.info(
+                    "[APIRouter] Attempting lazy recovery for %s",
+                    provider_name,
+                )
+                retry_candidates.append(provider_name)
+
+        return None, retry_candidates
+
+    def _choose_provider(
+        self, cheapest_available: Optional[str], recovery_results: Dict[str, bool]
+    ) -> str:
+        """
+        가장 싼 사용 가능 Provider와 복구 결과로 최종 Provider 선택
+
+        Args:
+            cheapest_available: 실패 기록이 없는 가장 싼 Provider 이름
+            recovery_results: 복구 시도한 Provider 이름별 성공 여부 (비용 오름차순)
+
+        Returns:
+            str: 선택된 Provider 이름
+        """
+        selected = None
+        for provider_name, recovered in recovery_results.items():
+            if recovered:
+                logger.info("[APIRouter] %s recovered!", provider_name)
+                # 복구 대상은 모두 cheapest_available보다 싸므로 첫 복구 Provider 선택
+                selected = selected or provider_name
+            else:
+                logger.warning("[APIRouter] %s still unhealthy", provider_name)
+
+        selected = selected or cheapest_available
+
+        if selected is None:
+            # 모두 실패 상태면 가장 싼 Provider를 기본값으로 사용
+            default = self._names_by_cost[0] if self._names_by_cost else "scraping"
+            logger.warning(
+                "[APIRouter] No available providers, using default: %s", default
+            )
+            return default
+
+        logger.info("[APIRouter] Selected %s provider (cheapest available)", selected)
+        return selected
+
+    def _should_retry_provider(self, provider_name: str) -> bool:
+        """
+        Provider가 재시도 가능한지 확인
+
+        실패한 지 RETRY_INTERVAL_SECONDS 이상 경과했는지 확인
+
+        Args:
+            provider_name: Provider 이름
+
+        Returns:
+            bool: True=재시도 가능, False=아직 대기 중
+        """
+        last_failed_at = self._get_last_failed_timestamp(provider_name)
+        return self._is_retry_due(provider_name, last_failed_at)
+
+    def _is_retry_due(
+        self, provider_name: str, last_failed_at: Optional[int]
+    ) -> bool:
+        """
+        실패 시각 기준으로 재시도 간격이 지났는지 확인
+
+        Args:
+            provider_name: Provider 이름 (로깅용)
+            last_failed_at: 마지막 실패 타임스탬프 (없으면 None)
+
+        Returns:
+            bool: True=재시도 가능, False=실패 기록 없음 또는 아직 대기 중
+        """
+        if last_failed_at is None:
+            # 실패 기록 없음
+            return False
+
+        elapsed = self._current_timestamp() - last_failed_at
+
+        # 워커마다 재시도 시점이 겹치지 않도록 실패마다 고정된 지연 추가
+        retry_interval = self.RETRY_INTERVAL_SECONDS + self._retry_jitter(
+            provider_name, last_failed_at
+        )
+
+        if elapsed >= retry_interval:
+            logger.debug(
+                "[APIRouter] %s retry interval elapsed (%ss)",
+                provider_name, elapsed,
+            )
+            return True
+        else:
+            logger.debug(
+                "[APIRouter] %s still in cooldown (%.1fs / %.1fs)",
+                provider_name, elapsed, retry_interval,
+            )
+            return False
+
+    def _retry_jitter(self, provider_name: str, last_failed_at: int) -> float:
+        """
+        실패 기록별 재시도 지연 (0 이상 RETRY_JITTER_SECONDS 미만)
+
+        확인할 때마다 새로 뽑으면 요청이 많을 때 0에 가까운 값이 곧 나와 지연이 사라지므로
+        Provider 이름과 실패 시각의 해시로 계산해 같은 실패에는 항상 같은 값을 사용
+
+        Args:
+            provider_name: Provider 이름
+            last_failed_at: 마지막 실패 타임스탬프
+
+        Returns:
+            float: 재시도 간격에 더할 지연 (초)
+        """
+        digest = hashlib.blake2b(
+            f"{provider_name}:{last_failed_at}".encode(),
+            digest_size=8,
+            key=self._retry_jitter_key,
+        ).digest()
+        return int.from_bytes(digest, "big") / 2**64 * self.RETRY_JITTER_SECONDS
+
+    def _schedule_recovery(
+        self, provider_names: List[str], request_data: WeatherForecastRequestSchema
+    ):
+        """
+        복구 헬스체크를 백그라운드에서 실행 (응답을 기다리지 않음)
+
+        결과는 실패 기록에 반영되어 다음 요청의 Provider 선택에 사용됨
+        이 프로세스에서 이미 복구가 예약/실행 중인 Provider는 다시 제출하지 않음
+        (재시도 시점의 요청마다 작업이 쌓이지 않도록)
+
+        Args:
+            provider_names: 복구 시도할 Provider 이름 리스트
+            request_data: 요청 데이터 (복구 시도용)
+        """
+        with self._recovery_in_flight_lock:
+            provider_names = [
+                name for name in provider_names if name not in self._recovery_in_flight
+            ]
+            self._recovery_in_flight.update(provider_names)
+
+        if not provider_names:
+            return
+
+        try:
+            _recovery_executor.submit(
+                self._run_background_recovery, provider_names, request_data
+            )
+        except BaseException:
+            self._finish_background_recovery(provider_names)
+            raise
+
+    def _run_background_recovery(
+        self, provider_names: List[str], request_data: WeatherForecastRequestSchema
+    ):
+        """
+        백그라운드 복구 헬스체크 실행 (예외는 로그만 남김)
+
+        Args:
+            provider_names: 복구 시도할 Provider 이름 리스트
+            request_data: 요청 데이터 (복구 시도용)
+        """
+        try:
+            self._try_recovery_many(provider_names, request_data)
+        except Exception as e:
+            logger.warning(
+                "[APIRouter] Background recovery failed for %s: %s", provider_names, e
+            )
+        finally:
+            self._finish_background_recovery(provider_names)
+
+    def _finish_background_recovery(self, provider_names: List[str]):
+        """
+        백그라운드 복구 완료 표시 (이후 재시도 시점에 다시 예약 가능)
+
+        Args:
+            provider_names: 복구를 마친 Provider 이름 리스트
+        """
+        with self._recovery_in_flight_lock:
+            self._recovery_in_flight.difference_update(provider_names)
+
+    def _try_recovery_many(
+        self, provider_names: List[str], request_data: WeatherForecastRequestSchema
+    ) -> Dict[str, bool]:
+        """
+        여러 Provider 복구 시도를 병렬로 실행
+
+        헬스체크를 동시에 실행하므로 전체 소요 시간은 합이 아닌 최댓값
+        제한 시간 내에 끝나지 않은 Provider는 복구 실패로 처리
+        결과는 모든 헬스체크가 끝난 뒤 한 번에 기록
+
+        Args:
+            provider_names: 복구 시도할 Provider 이름 리스트
+            request_data: 요청 데이터 (복구 시도용)
+
+        Returns:
+            Dict[str, bool]: Provider 이름별 복구 성공 여부
+        """
+        results = {name: False for name in provider_names}
+
+        # 다른 워커가 이미 헬스체크 중인 Provider는 이번 요청에서 실패로 처리
+        provider_names = self._acquire_recovery_locks(provider_names)
+        if not provider_names:
+            return results
+
+        executor = ThreadPoolExecutor(max_workers=len(provider_names))
+        futures = {
+            executor.submit(self._probe_provider, name): name
+            for name in provider_names
+        }
+
+        try:
+            for future in as_completed(
+                futures, timeout=self.RECOVERY_CHECK_DEADLINE_SECONDS
+            ):
+                results[futures[future]] = future.result()
+        except FuturesTimeoutError:
+            # 늦게 끝난 헬스체크 결과는 버리고 실패로 기록
+            for future, name in futures.items():
+                if not future.done():
+                    logger.warning("[APIRouter] %s recovery timed out", name)
+        finally:
+            # 느린 헬스체크를 기다리지 않음
+            executor.shutdown(wait=False)
+
+        self._apply_recovery_results(
+            {name: results[name] for name in provider_names}
+        )
+        return results
+
+    async def _try_recovery_many_async(self, provider_names: List[str]) -> Dict[str, bool]:
+        """
+        여러 Provider 복구 시도를 비동기로 동시 실행
+
+        제한 시간 내에 끝나지 않은 헬스체크는 취소하고 복구 실패로 처리
+
+        Args:
+            provider_names: 복구 시도할 Provider 이름 리스트
+
+        Returns:
+            Dict[str, bool]: Provider 이름별 복구 성공 여부
+        """
+        results = {name: False for name in provider_names}
+
+        provider_names = await _offload(self._acquire_recovery_locks)(provider_names)
+        if not provider_names:
+            return results
+
+        tasks = {
+            asyncio.create_task(self._probe_provider_async(name)): name
+            for name in provider_names
+        }
+
+        done, pending = await asyncio.wait(
+            tasks, timeout=self.RECOVERY_CHECK_DEADLINE_SECONDS
+        )
+
+        for task in done:
+            results[tasks[task]] = task.result()
+
+        for task in pending:
+            # 제한 시간을 넘긴 헬스체크는 취소하고 실패로 기록
+            task.cancel()
+            logger.warning("[APIRouter] %s recovery timed out", tasks[task])
+
+        await _offload(self._apply_recovery_results)(
+            {name: results[name] for name in provider_names}
+        )
+        return results
+
+    def _acquire_recovery_locks(self, provider_names: List[str]) -> List[str]:
+        """
+        복구 헬스체크 실행권 획득 (Redis SET NX EX)
+
+        RECOVERY_LOCK_TTL 동안 Provider별로 한 워커만 헬스체크를 실행하고,
+        나머지 워커는 그 결과가 실패 기록에 반영될 때까지 기다림
+
+        Args:
+            provider_names: 복구 시도할 Provider 이름 리스트
+
+        Returns:
+            List[str]: 실행권을 획득한 Provider 이름 리스트
+        """
+        acquired = []
+        for provider_name in provider_names:
+            lock_key = f"{self.RECOVERY_LOCK_KEY_PREFIX}:{provider_name}"
+            if cache.add(lock_key, 1, timeout=self.RECOVERY_LOCK_TTL):
+                acquired.append(provider_name)
+            else:
+                logger.debug(
+                    "[APIRouter] %s recovery already in progress, skipping",
+                    provider_name,
+                )
+        return acquired
+
+    def _probe_provider(self, provider_name: str) -> bool:
+        """
+        Provider 헬스체크 (결과 기록은 호출자가 일괄 처리)
+
+        Args:
+            provider_name: Provider 이름
+
+        Returns:
+            bool: True=정상, False=장애 또는 예외
+        """
+        provider = self.provider_map.get(provider_name)
+        if provider is None:
+            return False
+
+        try:
+            return provider.health_check()
+        except Exception as e:
+            logger.error("[APIRouter] %s recovery exception: %s", provider_name, e)
+            return False
+
+    async def _probe_provider_async(self, provider_name: str) -> bool:
+        """
+        Provider 헬스체크 (비동기, 결과 기록은 호출자가 일괄 처리)
+
+        Args:
+            provider_name: Provider 이름
+
+        Returns:
+            bool: True=정상, False=장애 또는 예외
+        """
+        provider = self.provider_map.get(provider_name)
+        if provider is None:
+            return False
+
+        try:
+            return await provider.health_check_async()
+        except Exception as e:
+            logger.error("[APIRouter] %s recovery exception: %s", provider_name, e)
+            return False
+
+    def _apply_recovery_results(self, recovery_results: Dict[str, bool]):
+        """
+        헬스체크 결과를 한 번에 반영
+
+        복구된 Provider는 실패 기록을 일괄 삭제(DEL), 여전히 실패한 Provider는
+        타임스탬프를 일괄 갱신(MSET)
+
+        Args:
+            recovery_results: Provider 이름별 헬스체크 결과
+        """
+        recovered_keys = []
+        failed_keys = []
+        for provider_name, is_healthy in recovery_results.items():
+            if is_healthy:
+                logger.info("[APIRouter] %s recovery successful", provider_name)
+                recovered_keys.append(f"{self.FAILED_KEY_PREFIX}:{provider_name}")
+            else:
+                logger.warning("[APIRouter] %s recovery failed", provider_name)
+                failed_keys.append(f"{self.FAILED_KEY_PREFIX}:{provider_name}")
+
+        if recovered_keys:
+            cache.delete_many(recovered_keys)
+        if failed_keys:
+            now = self._current_timestamp()
+            cache.set_many(
+                {key: now for key in failed_keys},
+                timeout=self._jittered(self.FAILED_CACHE_TTL),
+            )
+        self._invalidate_local_routing()
+
+    def _get_last_failed_timestamp(self, provider_name: str) -> Optional[int]:
+        """
+        마지막 실패 타임스탬프 조회
+
+        Args:
+            provider_name: Provider 이름
+
+        Returns:
+            Optional[int]: Unix timestamp, 초 단위 (없으면 None)
+        """
+        cache_key = f"{self.FAILED_KEY_PREFIX}:{provider_name}"
+        timestamp = cache.get(cache_key)
+        return int(timestamp) if timestamp is not None else None
+
+    def _mark_provider_failed(self, provider_name: str):
+        """
+        Provider를 실패 상태로 마킹 (타임스탬프 저장)
+
+        Args:
+            provider_name: Provider 이름
+        """
+        cache_key = f"{self.FAILED_KEY_PREFIX}:{provider_name}"
+        cache.set(
+            cache_key,
+            self._current_timestamp(),
+            timeout=self._jittered(self.FAILED_CACHE_TTL),
+        )
+        self._invalidate_local_routing()
+        logger.info("[APIRouter] Marked %s as failed", provider_name)
+
+    def _clear_failed_timestamp(self, provider_name: str):
+        """
+        Provider 실패 기록 삭제 (복구 완료)
+
+        Args:
+            provider_name: Provider 이름
+        """
+        cache_key = f"{self.FAILED_KEY_PREFIX}:{provider_name}"
+        cache.delete(cache_key)
+        self._invalidate_local_routing()
+        logger.info("[APIRouter] Cleared failed status for %s", provider_name)
+
+    def _call_with_fallback(
+        self,
+        primary_provider_name: str,
+        request_data: WeatherForecastRequestSchema,
+        primary_routed: bool = False,
+        failed_timestamps: Optional[Dict[str, Optional[int]]] = None,
+        pin_routing: bool = True,
+    ) -> WeatherForecastResponseSchema:
+        """
+        Primary API 호출 및 폴백 처리 (헤지 요청)
+
+        Primary는 요청 스레드에서 직접 호출하고, HEDGE_DELAY_SECONDS 안에 끝나지 않으면
+        첫 Fallback을 헤지 스레드에서 미리 호출 (빈 헤지 스레드가 없으면 생략)
+        Primary가 실패하면 이미 시작한 헤지 결과를 사용해 Fallback 대기 시간을 줄이고,
+        Primary가 성공하면 헤지 결과는 버림 (지연 전에 끝나면 헤지 호출을 보내지 않음)
+
+        Args:
+            primary_provider_name: Primary Provider 이름
+            request_data: 요청 데이터
+            primary_routed: Primary가 이미 라우팅 캐시에 있고 실패 기록이 없는지 여부
+            failed_timestamps: 요청 시작 시 조회한 실패 타임스탬프 (불필요한 삭제 생략용)
+            pin_routing: Primary 성공 시 라우팅 캐시 저장 여부
+                (더 싼 Provider 복구가 진행 중이면 False)
+
+        Returns:
+            WeatherForecastResponseSchema: 응답
+
+        Raises:
+            Exception: 모든 API 실패 시
+        """
+        chain = self._fallback_chain.get(primary_provider_name)
+        if chain is None:
+            raise Exception(f"Provider not found: {primary_provider_name}")
+
+        fallback_providers = chain[1:]
+        has_fallback = bool(fallback_providers)
+
+        hedge = None
+        if has_fallback:
+            hedge = self._schedule_hedge(
+                fallback_providers[0].provider_name, request_data
+            )
+
+        try:
+            response = self._call_provider(
+                primary_provider_name, request_data, is_primary=True
+            )
+        except Exception as e:
+            primary_error = e
+            hedge_future = hedge.close() if hedge is not None else None
+        else:
+            if hedge is not None:
+                self._discard_hedge(hedge)
+            self._record_first_success(
+                primary_provider_name,
+                primary_provider_name,
+                primary_failed=False,
+                primary_routed=primary_routed,
+                failed_timestamps=failed_timestamps,
+                pin_routing=pin_routing,
+            )
+            return response
+
+        # Primary 실패: 비용 순으로 Fallback 호출 (헤지로 시작한 호출은 결과만 기다림)
+        for index, fallback_provider in enumerate(fallback_providers):
+            fallback_name = fallback_provider.provider_name
+            try:
+                if index == 0 and hedge_future is not None:
+                    response = hedge_future.result()
+                else:
+                    response = self._call_provider(fallback_name, request_data)
+            except Exception:
+                continue
+
+            self._record_first_success(
+                fallback_name,
+                primary_provider_name,
+                primary_failed=True,
+                primary_routed=primary_routed,
+                failed_timestamps=failed_timestamps,
+                pin_routing=pin_routing,
+            )
+            return response
+
+        if not has_fallback:
+            raise Exception(
+                f"No fallback provider available, primary failed: {primary_error}"
+            )
+
+        # 모든 Provider 실패
+        raise Exception("All providers failed")
+
+    def _schedule_hedge(
+        self, provider_name: str, request_data: WeatherForecastRequestSchema
+    ) -> _PendingHedge:
+        """
+        HEDGE_DELAY_SECONDS 후 헤지 Fallback 호출 예약
+
+        Args:
+            provider_name: 헤지로 호출할 Fallback Provider 이름
+            request_data: 요청 데이터
+
+        Returns:
+            _PendingHedge: Primary가 끝나면 close()할 헤지 상태
+        """
+        hedge = _PendingHedge(provider_name)
+        _hedge_timer.call_later(
+            self.HEDGE_DELAY_SECONDS,
+            functools.partial(
+                hedge.start,
+                functools.partial(self._submit_hedge_call, provider_name, request_data),
+            ),
+        )
+        return hedge
+
+    def _submit_hedge_call(
+        self, provider_name: str, request_data: WeatherForecastRequestSchema
+    ) -> Optional[Future]:
+        """
+        헤지 Fallback 호출을 스레드 풀에 제출
+
+        실행 슬롯을 기다리지 않고 확보하므로 호출은 큐에서 대기하지 않고 바로 시작되며,
+        빈 슬롯이 없으면 헤지를 생략 (과부하 상황에서 유료 헤지 호출이 늘지 않도록)
+
+        Args:
+            provider_name: Provider 이름
+            request_data: 요청 데이터
+
+        Returns:
+            Optional[Future]: 호출 Future (헤지를 생략하면 None)
+        """
+        if not _hedge_call_slots.acquire(blocking=False):
+            logger.debug(
+                "[APIRouter] No idle hedge thread, skipping hedge: %s", provider_name
+            )
+            return None
+
+        try:
+            future = _hedge_call_executor.submit(
+                self._call_provider, provider_name, request_data
+            )
+        except BaseException:
+            _hedge_call_slots.release()
+            raise
+
+        future.add_done_callback(_release_hedge_call_slot)
+        logger.info("[APIRouter] Primary slow, hedging with fallback: %s", provider_name)
+        return future
+
+    def _discard_hedge(self, hedge: _PendingHedge):
+        """
+        Primary가 성공해 필요 없어진 헤지 정리
+
+        제출 전이면 제출하지 않고, 시작 전이면 취소, 진행 중이면 결과만 기록
+
+        Args:
+            hedge: Primary 호출 중 예약한 헤지
+        """
+        future = hedge.close()
+        if future is not None and not future.cancel():
+            future.add_done_callback(
+                functools.partial(self._log_discarded_call, hedge.provider_name)
+            )
+
+    def _record_first_success(
+        self,
+        winner_name: str,
+        primary_provider_name: str,
+        primary_failed: bool,
+        primary_routed: bool,
+        failed_timestamps: Optional[Dict[str, Optional[int]]],
+        pin_routing: bool = True,
+    ):
+        """
+        가장 먼저 성공한 호출의 성공 기록
+
+        - Primary 성공: 라우팅 캐시에 이미 있거나 pin_routing=False면 메트릭만,
+          아니면 라우팅 저장
+        - Primary 실패 후 Fallback 성공: 라우팅을 Fallback으로 변경
+        - 실패하지 않은(느린) Primary를 헤지 Fallback이 앞선 경우(비동기 경로): 메트릭만 증가
+          (응답 지연 한 번으로 ROUTING_CACHE_TTL 동안 비싼 Provider로 라우팅되지 않도록)
+
+        Args:
+            winner_name: 가장 먼저 성공한 Provider 이름
+            primary_provider_name: Primary Provider 이름
+            primary_failed: Primary 호출이 실패로 끝났는지 여부
+            primary_routed: Primary가 이미 라우팅 캐시에 있고 실패 기록이 없는지 여부
+            failed_timestamps: 요청 시작 시 조회한 실패 타임스탬프
+            pin_routing: Primary 성공 시 라우팅 캐시 저장 여부
+                (더 싼 Provider 복구가 백그라운드에서 진행 중이면 False,
+                복구 결과가 다음 요청의 동적 할당에 반영되도록)
+        """
+        if winner_name == primary_provider_name:
+            metrics_only = primary_routed or not pin_routing
+        elif primary_failed:
+            metrics_only = False
+            logger.info("[APIRouter] Fallback successful: %s", winner_name)
+        else:
+            metrics_only = True
+            logger.info(
+                "[APIRouter] Hedged fallback won: %s (routing kept on %s)",
+                winner_name, primary_provider_name,
+            )
+
+        self._record_success(
+            winner_name,
+            metrics_only=metrics_only,
+            clear_failed=self._needs_failed_clear(winner_name, failed_timestamps),
+        )
+
+    def _call_provider(
+        self,
+        provider_name: str,
+        request_data: WeatherForecastRequestSchema,
+        is_primary: bool = False,
+    ) -> WeatherForecastResponseSchema:
+        """
+        단일 Provider 동기 호출 (실패 시 실패 기록 후 예외 재발생)
+
+        Args:
+            provider_name: Provider 이름
+            request_data: 요청 데이터
+            is_primary: Primary Provider 여부 (로깅용)
+
+        Returns:
+            WeatherForecastResponseSchema: 응답
+        """
+        role = "primary" if is_primary else "fallback"
+        try:
+            logger.info("[APIRouter] Calling %s provider: %s", role, provider_name)
+            return self.provider_map[provider_name].get_weather_forecast(request_data)
+        except Exception as e:
+            logger.error(
+                "[APIRouter] %s provider failed: %s, error: %s",
+                role.capitalize(), provider_name, e,
+            )
+            self._record_failure(provider_name)
+            raise
+
+    def _log_discarded_call(self, provider_name: str, future: Future):
+        """
+        다른 Provider가 먼저 성공해 버려진 호출 결과 로깅
+
+        성공한 호출은 낭비된 비용으로만 기록 (실패로 기록하지 않음)
+
+        Args:
+            provider_name: Provider 이름
+            future: 버려진 호출의 Future
+        """
+        if future.exception() is None:
+            logger.info(
+                "[APIRouter] Discarded hedged response from %s (wasted cost: %s)",
+                provider_name, self.provider_map[provider_name].cost_per_request,
+            )
+
+    async def _call_with_fallback_async(
+        self,
+        primary_provider_name: str,
+        request_data: WeatherForecastRequestSchema,
+        primary_routed: bool = False,
+        failed_timestamps: Optional[Dict[str, Optional[int]]] = None,
+        pin_routing: bool = True,
+    ) -> WeatherForecastResponseSchema:
+        """
+        Primary API 호출 및 폴백 처리 (비동기, 헤지 요청)
+
+        Primary가 HEDGE_DELAY_SECONDS 내에 응답하지 않거나 실패하면
+        다음 Fallback을 동시에 호출하고, 가장 먼저 성공한 응답을 반환
+        나머지 진행 중인 호출은 취소
+
+        Args:
+            primary_provider_name: Primary Provider 이름
+            request_data: 요청 데이터
+            primary_routed: Primary가 이미 라우팅 캐시에 있고 실패 기록이 없는지 여부
+            failed_timestamps: 요청 시작 시 조회한 실패 타임스탬프 (불필요한 삭제 생략용)
+            pin_routing: Primary 성공 시 라우팅 캐시 저장 여부
+                (더 싼 Provider 복구가 진행 중이면 False)
+
+        Returns:
+            WeatherForecastResponseSchema: 응답
+
+        Raises:
+            Exception: 모든 API 실패 시
+        """
+        chain = self._fallback_chain.get(primary_provider_name)
+        if chain is None:
+            raise Exception(f"Provider not found: {primary_provider_name}")
+
+        fallback_providers = iter(chain[1:])
+        has_fallback = len(chain) > 1
+
+        task_names: Dict[asyncio.Task, str] = {}
+        primary_task = asyncio.create_task(
+            self._call_provider_async(primary_provider_name, request_data, is_primary=True)
+        )
+        task_names[primary_task] = primary_provider_name
+        pending = {primary_task}
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self.HEDGE_DELAY_SECONDS,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                for task in done:
+                    if task.exception() is None:
+                        self._record_first_success(
+                            task_names[task],
+                            primary_provider_name,
+                            primary_failed=(
+                                primary_task.done()
+                                and primary_task.exception() is not None
+                            ),
+                            primary_routed=primary_routed,
+                            failed_timestamps=failed_timestamps,
+                            pin_routing=pin_routing,
+                        )
+                        return task.result()
+
+                # 실패했거나 응답이 늦으면 다음 Fallback 동시 호출
+                fallback_provider = next(fallback_providers, None)
+                if fallback_provider is not None:
+                    fallback_name = fallback_provider.provider_name
+                    if not done:
+                        logger.info(
+                            "[APIRouter] Primary slow, hedging with fallback: %s",
+                            fallback_name,
+                        )
+                    fallback_task = asyncio.create_task(
+                        self._call_provider_async(fallback_name, request_data)
+                    )
+                    task_names[fallback_task] = fallback_name
+                    pending.add(fallback_task)
+        finally:
+            # 먼저 성공한 응답이 있으면 나머지 호출 취소
+            for task in pending:
+                task.cancel()
+
+        if not has_fallback:
+            raise Exception(
+                f"No fallback provider available, primary failed: {primary_task.exception()}"
+            )
+
+        # 모든 Provider 실패
+        raise Exception("All providers failed")
+
+    async def _call_provider_async(
+        self,
+        provider_name: str,
+        request_data: WeatherForecastRequestSchema,
+        is_primary: bool = False,
+    ) -> WeatherForecastResponseSchema:
+        """
+        단일 Provider 비동기 호출 (실패 시 실패 기록 후 예외 재발생)
+
+        Args:
+            provider_name: Provider 이름
+            request_data: 요청 데이터
+            is_primary: Primary Provider 여부 (로깅용)
+
+        Returns:
+            WeatherForecastResponseSchema: 응답
+        """
+        role = "primary" if is_primary else "fallback"
+        try:
+            logger.info(
+                "[APIRouter] Calling %s provider (async): %s",
+                role, provider_name,
+            )
+            return await self.provider_map[provider_name].get_weather_forecast_async(
+                request_data
+            )
+        except Exception as e:
+            logger.error(
+                "[APIRouter] %s provider failed: %s, error: %s",
+                role.capitalize(), provider_name, e,
+            )
+            await _offload(self._record_failure)(provider_name)
+            raise
+
+    def _record_success(
+        self,
+        provider_name: str,
+        metrics_only: bool = False,
+        clear_failed: bool = True,
+    ):
+        """
+        호출 성공 기록 (백그라운드)
+
+        현재 응답의 정확성과 무관하므로 사용자 응답 경로를 막지 않도록
+        백그라운드 스레드에서 _finalize_success 실행
+
+        Args:
+            provider_name: Provider 이름
+            metrics_only: True면 성공 메트릭만 증가 (라우팅 캐시에 이미 있고 실패 기록이
+                없거나, 라우팅을 바꾸지 않아야 하는 헤지 성공)
+            clear_failed: 실패 기록 삭제 여부 (기록이 없다고 알려진 경우 False)
+        """
+        _bookkeeping_executor.submit(
+            self._finalize_success, provider_name, metrics_only, clear_failed
+        )
+
+    def _finalize_success(
+        self, provider_name: str, metrics_only: bool, clear_failed: bool
+    ):
+        """
+        호출 성공 기록: 라우팅 캐시 저장, 성공 메트릭 증가, 실패 기록 삭제
+
+        Redis 백엔드면 라우팅 저장, 메트릭 증가, 실패 기록 삭제를 한 번의 왕복으로 전송
+        기록 실패는 로그만 남김 (메트릭 일부 유실 허용)
+
+        Args:
+            provider_name: Provider 이름
+            metrics_only: True면 성공 메트릭만 증가
+            clear_failed: 실패 기록 삭제 여부
+        """
+        try:
+            self._write_success(provider_name, metrics_only, clear_failed)
+        except Exception as e:
+            logger.warning(
+                "[APIRouter] Failed to record success for %s: %s", provider_name, e
+            )
+
+    def _write_success(
+        self, provider_name: str, metrics_only: bool, clear_failed: bool
+    ):
+        """
+        성공 기록 캐시 쓰기
+
+        Args:
+            provider_name: Provider 이름
+            metrics_only: True면 성공 메트릭만 증가
+            clear_failed: 실패 기록 삭제 여부
+        """
+        if metrics_only:
+            self._increment_success_metric(provider_name)
+            return
+
+        pipeline = self._get_redis_pipeline()
+        if pipeline is None:
+            self._set_cached_routing(provider_name)
+            self._increment_success_metric(provider_name)
+            if clear_failed:
+                self._clear_failed_timestamp(provider_name)
+            return
+
+        # cache.get()과 호환되도록 django-redis 직렬화 형식으로 저장
+        pipeline.set(
+            cache.make_key(self.ROUTING_KEY),
+            cache.client.encode(provider_name),
+            ex=self._jittered(self.ROUTING_CACHE_TTL),
+        )
+        metric = self._queue_metric_increment(
+            pipeline, f"{self.METRICS_KEY_PREFIX}:{provider_name}:success"
+        )
+        if clear_failed:
+            pipeline.delete(cache.make_key(f"{self.FAILED_KEY_PREFIX}:{provider_name}"))
+        self._execute_with_metric(pipeline, metric)
+        self._invalidate_local_routing()
+
+        logger.debug("[APIRouter] Cached routing: %s", provider_name)
+        if clear_failed:
+            logger.info("[APIRouter] Cleared failed status for %s", provider_name)
+
+    def _record_failure(self, provider_name: str):
+        """
+        호출 실패 기록: 실패 메트릭 증가, 실패 타임스탬프 저장
+
+        Redis 백엔드면 두 쓰기를 한 번의 왕복으로 전송
+
+        Args:
+            provider_name: Provider 이름
+        """
+        pipeline = self._get_redis_pipeline()
+        if pipeline is None:
+            self._increment_failure_metric(provider_name)
+            self._mark_provider_failed(provider_name)
+            return
+
+        metric = self._queue_metric_increment(
+            pipeline, f"{self.METRICS_KEY_PREFIX}:{provider_name}:failure"
+        )
+        pipeline.set(
+            cache.make_key(f"{self.FAILED_KEY_PREFIX}:{provider_name}"),
+            cache.client.encode(self._current_timestamp()),
+            ex=self._jittered(self.FAILED_CACHE_TTL),
+        )
+        self._execute_with_metric(pipeline, metric)
+        self._invalidate_local_routing()
+        logger.info("[APIRouter] Marked %s as failed", provider_name)
+
+    def _increment_success_metric(self, provider_name: str):
+        """성공 메트릭 증가"""
+        self._increment_metric(f"{self.METRICS_KEY_PREFIX}:{provider_name}:success")
+
+    def _increment_failure_metric(self, provider_name: str):
+        """실패 메트릭 증가"""
+        self._increment_metric(f"{self.METRICS_KEY_PREFIX}:{provider_name}:failure")
+
+    def _increment_metric(self, cache_key: str):
+        """
+        메트릭 카운터 증가
+
+        Redis 백엔드면 파이프라인 INCR (키가 없으면 INCR이 생성, 이때만 TTL 설정)
+        그 외 백엔드는 incr 실패 시 초기값 저장
+        두 경우 모두 처음 생성된 시점부터 METRICS_CACHE_TTL 동안 집계 (고정 윈도우)
+
+        Args:
+            cache_key: 메트릭 캐시 키
+        """
+        pipeline = self._get_redis_pipeline()
+        if pipeline is not None:
+            self._execute_with_metric(
+                pipeline, self._queue_metric_increment(pipeline, cache_key)
+            )
+            return
+
+        try:
+            cache.incr(cache_key)
+        except ValueError:
+            cache.set(cache_key, 1, timeout=self._jittered(self.METRICS_CACHE_TTL))
+
+    def _queue_metric_increment(self, pipeline, cache_key: str) -> Tuple[int, str]:
+        """
+        파이프라인에 메트릭 증가 명령 추가
+
+        Args:
+            pipeline: Redis 파이프라인
+            cache_key: 메트릭 캐시 키 (접두사 적용 전)
+
+        Returns:
+            Tuple[int, str]: (파이프라인 내 INCR 명령 위치, 접두사 적용된 Redis 키)
+        """
+        redis_key = cache.make_key(cache_key)
+        position = len(pipeline)
+        pipeline.incr(redis_key)
+        return position, redis_key
+
+    def _execute_with_metric(self, pipeline, metric: Tuple[int, str]):
+        """
+        파이프라인 전송 후 이번에 생성된 메트릭 카운터에만 TTL 설정
+
+        INCR마다 EXPIRE하면 트래픽이 이어지는 동안 만료가 계속 연장되어 카운터가
+        초기화되지 않으므로, INCR 결과가 1일 때만 TTL 설정 (기존 TTL은 유지)
+
+        Args:
+            pipeline: 명령이 쌓인 Redis 파이프라인
+            metric: _queue_metric_increment 반환값 (INCR 명령 위치, Redis 키)
+        """
+        position, redis_key = metric
+        results = pipeline.execute()
+        if results[position] == 1:
+            pipeline.expire(redis_key, self._jittered(self.METRICS_CACHE_TTL))
+            pipeline.execute()
+
+    def _current_timestamp(self) -> int:
+        """
+        실패 기록용 현재 시각
+
+        실패 기록은 워커 간 Redis로 공유되므로 프로세스마다 기준이 다른
+        monotonic 대신 Unix 시각을 초 단위 정수로 사용
+
+        Returns:
+            int: 현재 Unix timestamp (초)
+        """
+        return int(time.time())
+
+    def _jittered(self, ttl: int) -> int:
+        """
+        TTL에 ±TTL_JITTER_RATIO 랜덤 편차 적용
+
+        같은 TTL로 저장된 키들이 한꺼번에 만료되지 않도록 분산
+
+        Args:
+            ttl: 기준 TTL (초)
+
+        Returns:
+            int: 편차가 적용된 TTL (초)
+        """
+        ratio = random.uniform(-self.TTL_JITTER_RATIO, self.TTL_JITTER_RATIO)
+        return int(ttl * (1 + ratio))
+
+    def _get_redis_pipeline(self):
+        """
+        Redis 파이프라인 반환
+
+        Returns:
+            django-redis 백엔드면 파이프라인, 그 외 캐시 백엔드면 None
+        """
+        try:
+            return get_redis_connection("default").pipeline(transaction=False)
+        except NotImplementedError:
+            return None
 
 
 # 전역 인스턴스 (싱글톤 패턴)
 _api_router_instance = None
+_api_router_lock = threading.Lock()
 
 
 def get_api_router(providers: Optional[List[IWeatherAPIProvider]] = None) -> APIRouter:
@@ -418,8 +2018,11 @@ def get_api_router(providers: Optional[List[IWeatherAPIProvider]] = None) -> API
     if providers is not None:
         return APIRouter(providers=providers)
 
-    # 싱글톤 사용
+    # 싱글톤 사용 (서버 진입점 config/asgi.py, config/wsgi.py에서 미리 생성됨)
+    # 멀티스레드 워커에서 중복 생성되지 않도록 최초 생성 시에만 락 사용
     if _api_router_instance is None:
-        _api_router_instance = APIRouter()
+        with _api_router_lock:
+            if _api_router_instance is None:
+                _api_router_instance = APIRouter()
 
     return _api_router_instance
@@ -13,4 +13,15 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Django 설정 로드 이후 import (캐시/Provider 설정 사용)
+from apps.weather.health_check import HealthCheckInterceptor  # noqa: E402
+from apps.weather.services.api_router import get_api_router  # noqa: E402
+
+# API Router 싱글톤을 서버 시작 시점에 생성 (첫 요청에서 Provider/세션 생성 비용 제거)
+# migrate, shell, 테스트 등 관리 명령에서는 만들지 않도록 서버 진입점에서만 실행
+get_api_router()
+
+# /healthz, /readyz 프로브는 Django 미들웨어를 거치지 않고 바로 응답
+application = HealthCheckInterceptor(django_application)
@@ -146,6 +146,9 @@ AUTH_USER_MODEL = 'apps.user.User'
 # Weather API Settings (for demo purposes)
 WEATHER_API_KEY = os.getenv('WEATHER_API_KEY', 'demo-api-key-12345')
 
+# 요청 워커 스레드 수 (APIRouter의 헤지 호출 스레드 풀 크기 산정용)
+WEATHER_REQUEST_WORKER_THREADS = int(os.getenv('WEATHER_REQUEST_WORKER_THREADS', '16'))
+
 # Redis Cache Settings
 CACHES = {
     'default': {
@@ -155,6 +158,9 @@ CACHES = {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
             'SOCKET_CONNECT_TIMEOUT': 5,
             'SOCKET_TIMEOUT': 5,
+            # 요청/헤지/백그라운드 스레드가 풀을 공유하므로 소진 시 ConnectionError 대신 대기
+            'CONNECTION_POOL_CLASS': 'redis.BlockingConnectionPool',
+            'CONNECTION_POOL_KWARGS': {'max_connections': 50, 'timeout': 5},
         },
         'KEY_PREFIX': 'weather',
     }
@@ -14,3 +14,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
+
+# Django 설정 로드 이후 import (캐시/Provider 설정 사용)
+from apps.weather.services.api_router import get_api_router  # noqa: E402
+
+# API Router 싱글톤을 서버 시작 시점에 생성 (첫 요청에서 Provider/세션 생성 비용 제거)
+get_api_router()
@@ -0,0 +1,29 @@
+# tests/mixins.py
+"""
+테스트 공용 Mixin
+"""
+
+import uuid
+
+from django.test import override_settings
+
+
+class IsolatedCacheMixin:
+    """
+    테스트마다 고유 LOCATION의 LocMemCache 사용
+
+    cache.clear()(Redis FLUSHDB) 왕복 없이 테스트 간 캐시를 격리
+    """
+
+    def setUp(self):
+        super().setUp()
+        cache_override = override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                    "LOCATION": f"test-{uuid.uuid4().hex}",
+                }
+            }
+        )
+        cache_override.enable()
+        self.addCleanup(cache_override.disable)
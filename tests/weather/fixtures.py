@@ -0,0 +1,31 @@
+# tests/weather/fixtures.py
+"""
+날씨 테스트 공용 요청 데이터
+
+모듈 import 시 한 번만 생성하여 여러 테스트가 공유
+스키마는 validate_assignment 모델이라 변경 가능하므로 테스트에서 수정하지 말 것
+(변경이 필요하면 model_copy 사용)
+"""
+
+from apps.weather.services.weather_api.schemas import (
+    WeatherForecastRequestSchema,
+    LocationSchema,
+    DateRangeSchema,
+    ForecastOptionsSchema,
+)
+
+# 서울, 시간별 예보 제외
+SEOUL_REQUEST = WeatherForecastRequestSchema(
+    api_key="test-key",
+    location=LocationSchema(city="Seoul", country_code="KR"),
+    date_range=DateRangeSchema(start="2024-01-01", end="2024-01-31"),
+    options=ForecastOptionsSchema(include_hourly="N", units="metric"),
+)
+
+# 부산, 시간별 예보 포함 (외부 Provider용 API 키)
+BUSAN_EXTERNAL_REQUEST = WeatherForecastRequestSchema(
+    api_key="external-key",
+    location=LocationSchema(city="Busan", country_code="KR"),
+    date_range=DateRangeSchema(start="2024-01-01", end="2024-01-31"),
+    options=ForecastOptionsSchema(include_hourly="Y", units="metric"),
+)
@@ -3,12 +3,17 @@
 API Router 테스트 (Lazy 헬스체크 버전)
 """
 
-from unittest.mock import MagicMock, patch
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import threading
 import time
-from django.test import TestCase
+from django.test import SimpleTestCase
 from django.core.cache import cache
+from django_redis.cache import RedisCache
 
-from apps.weather.services.api_router import APIRouter
+from apps.weather.services.api_router import APIRouter, get_api_router
 from apps.weather.services.weather_api.schemas import (
     WeatherForecastRequestSchema,
     WeatherForecastResponseSchema,
@@ -16,14 +21,88 @@ from apps.weather.services.weather_api.schemas import (
     DateRangeSchema,
     ForecastOptionsSchema,
 )
+from tests.mixins import IsolatedCacheMixin
+from tests.weather.fixtures import BUSAN_EXTERNAL_REQUEST, SEOUL_REQUEST
 
 
-class TestAPIRouter(TestCase):
+# 실패 시각 계산에 사용하는 고정 시각 (Unix timestamp, 초)
+FROZEN_NOW = 1_700_000_000
+
+
+class _InlineExecutor:
+    """submit 즉시 실행하는 테스트용 Executor (백그라운드 성공 기록 검증용)"""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+class _RecordingPipeline:
+    """전송된 Redis 명령을 기록하는 테스트용 파이프라인 (INCR 결과는 counters로 계산)"""
+
+    def __init__(self, counters=None):
+        self.counters = dict(counters or {})
+        self.commands = []
+        self.execute_count = 0
+        self._queued = []
+
+    def __len__(self):
+        return len(self._queued)
+
+    def _queue(self, *command):
+        self.commands.append(command)
+        self._queued.append(command)
+
+    def set(self, key, value, ex=None):
+        self._queue("set", key, value, ex)
+
+    def incr(self, key):
+        self._queue("incr", key)
+
+    def expire(self, key, ttl):
+        self._queue("expire", key, ttl)
+
+    def delete(self, *keys):
+        self._queue("delete", *keys)
+
+    def execute(self):
+        self.execute_count += 1
+        results = []
+        for command in self._queued:
+            if command[0] == "incr":
+                self.counters[command[1]] = self.counters.get(command[1], 0) + 1
+                results.append(self.counters[command[1]])
+            else:
+                results.append(True)
+        self._queued = []
+        return results
+
+
+class TestAPIRouter(IsolatedCacheMixin, SimpleTestCase):
     """API Router 테스트 (Lazy 헬스체크)"""
 
+    # 테스트용 요청 데이터 (모듈 공용 인스턴스)
+    request_data = SEOUL_REQUEST
+
     def setUp(self):
-        # 각 테스트마다 캐시 초기화
-        cache.clear()
+        # 각 테스트마다 격리된 캐시 사용
+        super().setUp()
+
+        # 성공 기록과 복구 헬스체크를 백그라운드 대신 즉시 실행
+        for executor_name in ("_bookkeeping_executor", "_recovery_executor"):
+            patcher = patch(
+                f"apps.weather.services.api_router.{executor_name}", _InlineExecutor()
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        # 실패 시각/재시도 간격 계산용 시계 고정 (실제 시계와 무관하게 결정적)
+        self.clock_patcher = patch.object(
+            APIRouter, "_current_timestamp", return_value=FROZEN_NOW
+        )
+        self.clock_patcher.start()
+        self.addCleanup(self.clock_patcher.stop)
 
         # Mock Provider 생성
         self.mock_provider_a = MagicMock()
@@ -37,17 +116,6 @@ class TestAPIRouter(TestCase):
         # Router 생성
         self.router = APIRouter(providers=[self.mock_provider_a, self.mock_provider_b])
 
-        # 테스트용 요청 데이터
-        self.request_data = WeatherForecastRequestSchema(
-            api_key="test-key",
-            location=LocationSchema(city="Seoul", country_code="KR"),
-            date_range=DateRangeSchema(start="2024-01-01", end="2024-01-31"),
-            options=ForecastOptionsSchema(include_hourly="N", units="metric"),
-        )
-
-    def tearDown(self):
-        cache.clear()
-
     def test_route_request_cache_miss_success(self):
         """캐시 미스 시 동적 할당 및 성공"""
         # Mock 응답 설정
@@ -67,13 +135,58 @@ class TestAPIRouter(TestCase):
         self.mock_provider_a.get_weather_forecast.assert_called_once()
 
         # 캐시 확인
-        cached_provider = cache.get("routing:1")
+        cached_provider = cache.get("routing:current")
         self.assertEqual(cached_provider, "scraping")
 
+    def test_success_bookkeeping_does_not_block_response(self):
+        """성공 기록이 끝나지 않아도 응답 반환"""
+        mock_response = WeatherForecastResponseSchema(
+            temperature=20.0,
+            humidity=60,
+            condition="sunny",
+            forecast_date="2024-01-15"
+        )
+        self.mock_provider_a.get_weather_forecast.return_value = mock_response
+
+        release = threading.Event()
+        finished = threading.Event()
+
+        def slow_write(*args):
+            release.wait(1)
+            finished.set()
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        with patch("apps.weather.services.api_router._bookkeeping_executor", executor), \
+                patch.object(APIRouter, "_write_success", side_effect=slow_write):
+            response = self.router.route_request(user_id=1, request_data=self.request_data)
+            self.assertFalse(finished.is_set())
+            release.set()
+
+        self.assertEqual(response.temperature, 20.0)
+        self.assertTrue(finished.wait(1))
+
+    def test_route_request_serves_identical_request_from_cache(self):
+        """동일한 요청은 예보 응답 캐시에서 반환"""
+        mock_response = WeatherForecastResponseSchema(
+            temperature=20.0,
+            humidity=60,
+            condition="sunny",
+            forecast_date="2024-01-15"
+        )
+        self.mock_provider_a.get_weather_forecast.return_value = mock_response
+
+        first = self.router.route_request(user_id=1, request_data=self.request_data)
+        second = self.router.route_request(user_id=2, request_data=self.request_data)
+
+        # 두 번째 요청은 Provider를 호출하지 않음
+        self.assertEqual(second, first)
+        self.mock_provider_a.get_weather_forecast.assert_called_once()
+
     def test_route_request_cache_hit(self):
         """캐시 히트 시 캐시된 Provider 사용"""
         # 캐시에 미리 저장
-        cache.set("routing:1", "external", timeout=3600)
+        cache.set("routing:current", "external", timeout=3600)
 
         # Mock 응답 설정
         mock_response = WeatherForecastResponseSchema(
@@ -92,6 +205,102 @@ class TestAPIRouter(TestCase):
         self.mock_provider_b.get_weather_forecast.assert_called_once()
         self.mock_provider_a.get_weather_forecast.assert_not_called()
 
+    def test_route_request_ignores_unknown_cached_provider(self):
+        """라우팅 캐시에 등록되지 않은 Provider가 있으면 동적 할당"""
+        cache.set("routing:current", "removed-provider", timeout=3600)
+
+        mock_response = WeatherForecastResponseSchema(
+            temperature=20.0,
+            humidity=60,
+            condition="sunny",
+            forecast_date="2024-01-15"
+        )
+        self.mock_provider_a.get_weather_forecast.return_value = mock_response
+
+        response = self.router.route_request(user_id=1, request_data=self.request_data)
+
+        self.assertEqual(response.temperature, 20.0)
+        self.assertEqual(cache.get("routing:current"), "scraping")
+
+    def test_routing_state_served_from_local_cache_within_ttl(self):
+        """TTL 내에는 프로세스 로컬 라우팅 상태 사용"""
+        cache.set("routing:current", "external", timeout=3600)
+        forecast_key = self.router._get_forecast_cache_key(
+            self.router._get_request_hash(self.request_data)
+        )
+
+        _, first, _ = self.router._get_routing_state([forecast_key])
+
+        # 다른 프로세스가 라우팅을 변경해도 TTL 동안은 로컬 값 사용
+        cache.set("routing:current", "scraping", timeout=3600)
+        _, second, _ = self.router._get_routing_state([forecast_key])
+
+        self.assertEqual(first, "external")
+        self.assertEqual(second, "external")
+
+        # 이 프로세스가 라우팅을 변경하면 즉시 무효화
+        self.router._set_cached_routing("scraping")
+        _, third, _ = self.router._get_routing_state([forecast_key])
+        self.assertEqual(third, "scraping")
+
+    def test_route_request_cache_hit_skips_redundant_writes(self):
+        """캐시된 정상 Provider 성공 시 라우팅/실패 기록 갱신 생략"""
+        cache.set("routing:current", "external", timeout=3600)
+
+        mock_response = WeatherForecastResponseSchema(
+            temperature=15.0,
+            humidity=70,
+            condition="cloudy",
+            forecast_date="2024-01-20"
+        )
+        self.mock_provider_b.get_weather_forecast.return_value = mock_response
+
+        with patch.object(APIRouter, "_clear_failed_timestamp") as mock_clear:
+            self.router.route_request(user_id=1, request_data=self.request_data)
+
+        mock_clear.assert_not_called()
+        self.assertEqual(cache.get("api:metrics:external:success"), 1)
+
+    def test_fallback_success_skips_clear_when_not_failed(self):
+        """요청 시작 시 실패 기록이 없던 Fallback은 성공해도 삭제 요청 생략"""
+        self.mock_provider_a.get_weather_forecast.side_effect = Exception("API Error")
+        self.mock_provider_b.get_weather_forecast.return_value = (
+            WeatherForecastResponseSchema(
+                temperature=18.0,
+                humidity=65,
+                condition="rainy",
+                forecast_date="2024-01-25"
+            )
+        )
+
+        with patch.object(APIRouter, "_clear_failed_timestamp") as mock_clear:
+            self.router.route_request(user_id=1, request_data=self.request_data)
+
+        mock_clear.assert_not_called()
+        self.assertTrue(cache.has_key("api:failed:scraping"))
+
+    def test_route_request_reuses_failed_timestamps_from_single_lookup(self):
+        """라우팅 캐시 미스 시 일괄 조회한 실패 기록으로 Provider 선택"""
+        cache.set("api:failed:scraping", FROZEN_NOW, timeout=3600)
+
+        mock_response = WeatherForecastResponseSchema(
+            temperature=15.0,
+            humidity=70,
+            condition="cloudy",
+            forecast_date="2024-01-20"
+        )
+        self.mock_provider_b.get_weather_forecast.return_value = mock_response
+
+        with patch.object(
+            APIRouter, "_get_failed_timestamps", wraps=self.router._get_failed_timestamps
+        ) as mock_get_failed:
+            response = self.router.route_request(user_id=1, request_data=self.request_data)
+
+        # 실패 기록을 다시 조회하지 않고 external 선택
+        self.assertEqual(response.temperature, 15.0)
+        mock_get_failed.assert_not_called()
+        self.mock_provider_a.get_weather_forecast.assert_not_called()
+
     def test_fallback_on_primary_failure(self):
         """Primary Provider 실패 시 Fallback"""
         # Primary 실패, Fallback 성공
@@ -114,13 +323,348 @@ class TestAPIRouter(TestCase):
         self.mock_provider_b.get_weather_forecast.assert_called_once()
 
         # 캐시가 fallback Provider로 업데이트되어야 함
-        cached_provider = cache.get("routing:2")
+        cached_provider = cache.get("routing:current")
         self.assertEqual(cached_provider, "external")
 
         # 실패 타임스탬프가 저장되어야 함
         failed_timestamp = cache.get("api:failed:scraping")
         self.assertIsNotNone(failed_timestamp)
 
+    def test_route_request_hedges_slow_primary(self):
+        """동기 라우팅: Primary 응답이 늦으면 Fallback을 미리 호출하고, Primary가 성공하면 Primary 응답 반환"""
+        hedge_started = threading.Event()
+        primary_threads = []
+        primary_response = WeatherForecastResponseSchema(
+            temperature=20.0,
+            humidity=60,
+            condition="sunny",
+            forecast_date="2024-01-15"
+        )
+
+        def slow_primary(request_data):
+            primary_threads.append(threading.current_thread())
+            hedge_started.wait(1)
+            return primary_response
+
+        def hedge_fallback(request_data):
+            hedge_started.set()
+            return WeatherForecastResponseSchema(
+                temperature=18.0,
+                humidity=65,
+                condition="rainy",
+                forecast_date="2024-01-25"
+            )
+
+        self.mock_provider_a.get_weather_forecast.side_effect = slow_primary
+        self.mock_provider_b.get_weather_forecast.side_effect = hedge_fallback
+
+        with patch.object(APIRouter, "HEDGE_DELAY_SECONDS", 0.01):
+            response = self.router.route_request(user_id=2, request_data=self.request_data)
+
+        # Primary는 요청 스레드에서 실행되고, 헤지는 Primary 실행 중에 시작
+        self.assertEqual(primary_threads, [threading.current_thread()])
+        self.assertTrue(hedge_started.is_set())
+        self.mock_provider_b.get_weather_forecast.assert_called_once()
+
+        # 실패하지 않은 Primary 응답을 사용하고, 라우팅도 Primary로 유지
+        self.assertEqual(response.temperature, 20.0)
+        self.assertEqual(cache.get("routing:current"), "scraping")
+        self.assertFalse(cache.has_key("api:failed:scraping"))
+        self.assertIsNone(cache.get("api:metrics:external:success"))
+
+    def test_route_request_uses_hedge_when_slow_primary_fails(self):
+        """동기 라우팅: 느린 Primary가 실패하면 이미 시작한 헤지 결과를 사용 (Fallback 재호출 없음)"""
+        hedge_started = threading.Event()
+
+        def slow_failing_primary(request_data):
+            hedge_started.wait(1)
+            raise Exception("API Error")
+
+        def hedge_fallback(request_data):
+            hedge_started.set()
+            return WeatherForecastResponseSchema(
+                temperature=18.0,
+                humidity=65,
+                condition="rainy",
+                forecast_date="2024-01-25"
+            )
+
+        self.mock_provider_a.get_weather_forecast.side_effect = slow_failing_primary
+        self.mock_provider_b.get_weather_forecast.side_effect = hedge_fallback
+
+        with patch.object(APIRouter, "HEDGE_DELAY_SECONDS", 0.01):
+            response = self.router.route_request(user_id=2, request_data=self.request_data)
+
+        self.assertEqual(response.temperature, 18.0)
+        self.mock_provider_b.get_weather_forecast.assert_called_once()
+
+        # Primary가 실패했으므로 라우팅은 Fallback으로 변경
+        self.assertEqual(cache.get("routing:current"), "external")
+        self.assertTrue(cache.has_key("api:failed:scraping"))
+
+    def test_route_request_does_not_hedge_fast_primary(self):
+        """동기 라우팅: Primary가 헤지 지연 전에 끝나면 헤지 호출을 보내지 않음"""
+        self.mock_provider_a.get_weather_forecast.return_value = (
+            WeatherForecastResponseSchema(
+                temperature=20.0,
+                humidity=60,
+                condition="sunny",
+                forecast_date="2024-01-15"
+            )
+        )
+
+        with patch.object(APIRouter, "HEDGE_DELAY_SECONDS", 0.01):
+            response = self.router.route_request(user_id=2, request_data=self.request_data)
+            # 예약된 헤지 시점이 지나도 호출하지 않음
+            time.sleep(0.05)
+
+        self.assertEqual(response.temperature, 20.0)
+        self.mock_provider_b.get_weather_forecast.assert_not_called()
+
+    def test_route_request_skips_hedge_without_idle_hedge_thread(self):
+        """헤지 스레드가 모두 사용 중이면 헤지하지 않고 Primary를 기다림"""
+        primary_response = WeatherForecastResponseSchema(
+            temperature=20.0,
+            humidity=60,
+            condition="sunny",
+            forecast_date="2024-01-15"
+        )
+
+        def slow_primary(request_data):
+            time.sleep(0.05)
+            return primary_response
+
+        self.mock_provider_a.get_weather_forecast.side_effect = slow_primary
+
+        # 다른 요청의 헤지가 모든 실행 슬롯을 사용 중인 상황
+        busy_slots = threading.BoundedSemaphore(1)
+        busy_slots.acquire()
+        with patch.object(APIRouter, "HEDGE_DELAY_SECONDS", 0.01), patch(
+            "apps.weather.services.api_router._hedge_call_slots", busy_slots
+        ):
+            response = self.router.route_request(user_id=2, request_data=self.request_data)
+
+        self.assertEqual(response.temperature, 20.0)
+        self.mock_provider_b.get_weather_forecast.assert_not_called()
+
+    async def test_route_request_async_fallback_on_primary_failure(self):
+        """비동기 라우팅: Primary Provider 실패 시 Fallback"""
+        self.mock_provider_a.get_weather_forecast_async = AsyncMock(
+            side_effect=Exception("API Error")
+        )
+        mock_fallback_response = WeatherForecastResponseSchema(
+            temperature=18.0,
+            humidity=65,
+            condition="rainy",
+            forecast_date="2024-01-25"
+        )
+        self.mock_provider_b.get_weather_forecast_async = AsyncMock(
+            return_value=mock_fallback_response
+        )
+
+        # 실행
+        response = await self.router.route_request_async(
+            user_id=2, request_data=self.request_data
+        )
+
+        # 검증
+        self.assertEqual(response.temperature, 18.0)
+        self.mock_provider_a.get_weather_forecast_async.assert_awaited_once()
+        self.mock_provider_b.get_weather_forecast_async.assert_awaited_once()
+
+        # 라우팅 캐시가 fallback Provider로 업데이트되고 실패가 기록되어야 함
+        self.assertEqual(cache.get("routing:current"), "external")
+        self.assertTrue(cache.has_key("api:failed:scraping"))
+
+    async def test_route_request_async_hedges_slow_primary(self):
+        """비동기 라우팅: Primary 응답이 늦으면 Fallback을 동시 호출"""
+        primary_cancelled = asyncio.Event()
+
+        async def slow_primary(request_data):
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+
+        self.mock_provider_a.get_weather_forecast_async = AsyncMock(
+            side_effect=slow_primary
+        )
+        mock_fallback_response = WeatherForecastResponseSchema(
+            temperature=18.0,
+            humidity=65,
+            condition="rainy",
+            forecast_date="2024-01-25"
+        )
+        self.mock_provider_b.get_weather_forecast_async = AsyncMock(
+            return_value=mock_fallback_response
+        )
+
+        with patch.object(APIRouter, "HEDGE_DELAY_SECONDS", 0.01):
+            response = await self.router.route_request_async(
+                user_id=2, request_data=self.request_data
+            )
+
+        # Fallback 응답 반환, 늦은 Primary는 취소
+        self.assertEqual(response.temperature, 18.0)
+        await asyncio.wait_for(primary_cancelled.wait(), timeout=1)
+
+        # 취소된 Primary는 실패로 기록하지 않고, 라우팅도 Fallback으로 바꾸지 않음
+        self.assertIsNone(cache.get("routing:current"))
+        self.assertFalse(cache.has_key("api:failed:scraping"))
+        self.assertEqual(cache.get("api:metrics:external:success"), 1)
+
+    async def test_route_request_async_runs_cache_io_off_event_loop(self):
+        """비동기 라우팅의 캐시 조회/기록은 이벤트 루프 스레드 밖에서 실행"""
+        self.mock_provider_a.get_weather_forecast_async = AsyncMock(
+            side_effect=Exception("API Error")
+        )
+        self.mock_provider_b.get_weather_forecast_async = AsyncMock(
+            return_value=WeatherForecastResponseSchema(
+                temperature=18.0,
+                humidity=65,
+                condition="rainy",
+                forecast_date="2024-01-25"
+            )
+        )
+
+        loop_thread = threading.current_thread()
+        io_threads = {}
+
+        def record_thread(name):
+            original = getattr(APIRouter, name)
+
+            def wrapper(router, *args):
+                io_threads[name] = threading.current_thread()
+                return original(router, *args)
+
+            return patch.object(APIRouter, name, autospec=True, side_effect=wrapper)
+
+        with record_thread("_get_routing_state"), \
+                record_thread("_record_failure"), \
+                record_thread("_set_cached_forecast"):
+            await self.router.route_request_async(
+                user_id=2, request_data=self.request_data
+            )
+
+        self.assertEqual(
+            set(io_threads),
+            {"_get_routing_state", "_record_failure", "_set_cached_forecast"},
+        )
+        for thread in io_threads.values():
+            self.assertIsNot(thread, loop_thread)
+
+    async def test_route_many_async_calls_only_uncached_requests(self):
+        """일괄 라우팅: 캐시에 없는 요청만 중복 없이 호출하고 순서 유지"""
+        busan_request = WeatherForecastRequestSchema(
+            api_key="test-key",
+            location=LocationSchema(city="Busan", country_code="KR"),
+            date_range=DateRangeSchema(start="2024-01-01", end="2024-01-31"),
+            options=ForecastOptionsSchema(include_hourly="N", units="metric"),
+        )
+        cached_response = WeatherForecastResponseSchema(
+            temperature=20.0,
+            humidity=60,
+            condition="sunny",
+            forecast_date="2024-01-15"
+        )
+        self.router._set_cached_forecast(
+            self.router._get_request_hash(self.request_data), cached_response
+        )
+
+        busan_response = WeatherForecastResponseSchema(
+            temperature=12.0,
+            humidity=55,
+            condition="cloudy",
+            forecast_date="2024-01-15"
+        )
+        self.mock_provider_a.get_weather_forecast_async = AsyncMock(
+            return_value=busan_response
+        )
+
+        responses = await self.router.route_many_async(
+            user_id=1,
+            requests_data=[busan_request, self.request_data, busan_request],
+        )
+
+        self.assertEqual(responses, [busan_response, cached_response, busan_response])
+        self.mock_provider_a.get_weather_forecast_async.assert_awaited_once_with(
+            busan_request
+        )
+
+        # 새로 받은 응답은 요청별로 캐시됨
+        self.assertIsNotNone(
+            cache.get(
+                self.router._get_forecast_cache_key(
+                    self.router._get_request_hash(busan_request)
+                )
+            )
+        )
+
+    def test_route_many_closes_async_clients_of_its_loop(self):
+        """동기 일괄 라우팅은 새 이벤트 루프에서 실행하고 종료 전 AsyncClient를 닫음"""
+        mock_response = WeatherForecastResponseSchema(
+            temperature=20.0,
+            humidity=60,
+            condition="sunny",
+            forecast_date="2024-01-15"
+        )
+        self.mock_provider_a.get_weather_forecast_async = AsyncMock(
+            return_value=mock_response
+        )
+        for provider in (self.mock_provider_a, self.mock_provider_b):
+            provider.aclose_async_client = AsyncMock()
+
+        responses = self.router.route_many(
+            user_id=1, requests_data=[self.request_data]
+        )
+
+        self.assertEqual(responses, [mock_response])
+        self.mock_provider_a.aclose_async_client.assert_awaited_once()
+        self.mock_provider_b.aclose_async_client.assert_awaited_once()
+
+    def test_default_routers_share_provider_instances(self):
+        """기본 Provider는 Router 인스턴스 간 공유 (커넥션 풀 재사용)"""
+        first = APIRouter()
+        second = APIRouter()
+
+        self.assertEqual(
+            [p.provider_name for p in first.providers], ["scraping", "external"]
+        )
+        for a, b in zip(first.providers, second.providers):
+            self.assertIs(a, b)
+
+    def test_get_api_router_creates_single_instance_under_concurrency(self):
+        """여러 스레드가 동시에 호출해도 싱글톤은 한 번만 생성"""
+        created = []
+
+        def slow_router():
+            time.sleep(0.01)
+            created.append(True)
+            return self.router
+
+        results = []
+        barrier = threading.Barrier(8, timeout=1)
+
+        def worker():
+            barrier.wait()
+            results.append(get_api_router())
+
+        with patch("apps.weather.services.api_router._api_router_instance", None), \
+                patch(
+                    "apps.weather.services.api_router.APIRouter", side_effect=slow_router
+                ):
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(len(results), 8)
+        for router in results:
+            self.assertIs(router, self.router)
+
     def test_all_providers_fail(self):
         """모든 Provider 실패 시 예외 발생"""
         # 모든 Provider 실패
@@ -134,13 +678,38 @@ class TestAPIRouter(TestCase):
         self.assertIn("All providers failed", str(context.exception))
 
         # 모든 Provider가 실패 마킹되어야 함
-        self.assertIsNotNone(cache.get("api:failed:scraping"))
-        self.assertIsNotNone(cache.get("api:failed:external"))
+        self.assertTrue(cache.has_key("api:failed:scraping"))
+        self.assertTrue(cache.has_key("api:failed:external"))
+
+    def test_all_providers_fail_serves_last_good_response(self):
+        """모든 Provider 실패 시 마지막 정상 응답 반환 (stale-if-error)"""
+        mock_response = WeatherForecastResponseSchema(
+            temperature=20.0,
+            humidity=60,
+            condition="sunny",
+            forecast_date="2024-01-15"
+        )
+        self.mock_provider_a.get_weather_forecast.return_value = mock_response
+        self.router.route_request(user_id=1, request_data=self.request_data)
+
+        # 예보 캐시 만료 후 모든 Provider 장애
+        forecast_key = self.router._get_forecast_cache_key(
+            self.router._get_request_hash(self.request_data)
+        )
+        cache.delete(forecast_key)
+        self.mock_provider_a.get_weather_forecast.side_effect = Exception("A failed")
+        self.mock_provider_b.get_weather_forecast.side_effect = Exception("B failed")
+
+        response = self.router.route_request(user_id=1, request_data=self.request_data)
+
+        self.assertEqual(response, mock_response)
+        # 오래된 응답은 예보 캐시에 다시 저장하지 않음
+        self.assertFalse(cache.has_key(forecast_key))
 
     def test_select_provider_prefers_free(self):
         """동적 할당 시 무료 Provider 우선"""
         # 모두 정상 상태 (실패 기록 없음)
-        selected = self.router._select_provider(user_id=4, request_data=self.request_data)
+        selected = self.router._select_provider(request_data=self.request_data)
 
         # 무료인 scraping을 선택해야 함
         self.assertEqual(selected, "scraping")
@@ -150,78 +719,326 @@ class TestAPIRouter(TestCase):
         # scraping을 실패 상태로 마킹
         self.router._mark_provider_failed("scraping")
 
-        selected = self.router._select_provider(user_id=5, request_data=self.request_data)
+        selected = self.router._select_provider(request_data=self.request_data)
 
         # external을 선택해야 함
         self.assertEqual(selected, "external")
 
+    def test_select_provider_skips_recovery_of_pricier_provider(self):
+        """더 싼 Provider가 정상이면 비싼 Provider는 헬스체크하지 않음"""
+        # external을 재시도 가능한 실패 상태로 마킹 (과거 시점)
+        past_timestamp = FROZEN_NOW - 120  # 2분 전
+        cache.set("api:failed:external", past_timestamp, timeout=3600)
+
+        selected = self.router._select_provider(request_data=self.request_data)
+
+        self.assertEqual(selected, "scraping")
+        self.mock_provider_b.health_check.assert_not_called()
+        # 실패 기록은 그대로 유지
+        self.assertEqual(cache.get("api:failed:external"), past_timestamp)
+
+    def test_providers_ordered_by_cost(self):
+        """Provider 등록 순서와 무관하게 비용 오름차순 정렬"""
+        router = APIRouter(providers=[self.mock_provider_b, self.mock_provider_a])
+
+        self.assertEqual(router._names_by_cost, ("scraping", "external"))
+        self.assertEqual(
+            router._select_provider(request_data=self.request_data), "scraping"
+        )
+
+    def test_fallback_chain_ordered_by_cost(self):
+        """Fallback은 Primary를 제외하고 비용 오름차순으로 시도"""
+        # 호출되지 않으므로 이름과 비용만 가진 Stub 사용
+        premium = SimpleNamespace(provider_name="premium", cost_per_request=0.05)
+        router = APIRouter(
+            providers=[premium, self.mock_provider_b, self.mock_provider_a]
+        )
+
+        self.assertEqual(
+            router._fallback_chain["external"],
+            (self.mock_provider_b, self.mock_provider_a, premium),
+        )
+        self.assertEqual(
+            router._fallback_chain["premium"],
+            (premium, self.mock_provider_a, self.mock_provider_b),
+        )
+
     def test_lazy_recovery_after_interval(self):
-        """재시도 간격 후 Lazy 복구 시도"""
-        # scraping을 실패 상태로 마킹 (과거 시점)
-        past_timestamp = time.time() - 120  # 2분 전
-        cache.set("api:failed:scraping", past_timestamp, timeout=3600)
+        """재시도 간격 후 Lazy 복구 시도 (정상 Provider가 있으면 백그라운드)"""
+        for recovered in (True, False):
+            with self.subTest(recovered=recovered):
+                # 이전 케이스의 복구 락과 호출 기록 초기화
+                cache.delete("api:recovery_lock:scraping")
+                self.mock_provider_a.health_check.reset_mock()
 
-        # 헬스체크 성공으로 설정
-        self.mock_provider_a.health_check.return_value = True
+                # scraping을 실패 상태로 마킹 (과거 시점)
+                past_timestamp = FROZEN_NOW - 120  # 2분 전
+                cache.set("api:failed:scraping", past_timestamp, timeout=3600)
+                self.mock_provider_a.health_check.return_value = recovered
 
-        # Provider 선택
-        selected = self.router._select_provider(user_id=6, request_data=self.request_data)
+                # Provider 선택: 복구를 기다리지 않고 정상인 external 선택
+                selected = self.router._select_provider(request_data=self.request_data)
 
-        # 복구되어 scraping 선택되어야 함
-        self.assertEqual(selected, "scraping")
-        self.mock_provider_a.health_check.assert_called_once()
+                self.assertEqual(selected, "external")
+                self.mock_provider_a.health_check.assert_called_once()
 
-        # 실패 기록이 삭제되어야 함
-        failed_timestamp = cache.get("api:failed:scraping")
-        self.assertIsNone(failed_timestamp)
+                # 복구 성공이면 실패 기록 삭제, 실패면 갱신
+                failed_timestamp = cache.get("api:failed:scraping")
+                if recovered:
+                    self.assertIsNone(failed_timestamp)
+                else:
+                    self.assertGreater(failed_timestamp, past_timestamp)
+
+                # 다음 요청부터 복구된 scraping 선택 (실패면 여전히 external)
+                selected = self.router._select_provider(request_data=self.request_data)
+                self.assertEqual(selected, "scraping" if recovered else "external")
+
+    def test_background_recovery_reaches_next_request(self):
+        """백그라운드 복구가 성공하면 다음 요청부터 복구된 무료 Provider로 라우팅"""
+        past_timestamp = FROZEN_NOW - 120  # 2분 전
+        cache.set("api:failed:scraping", past_timestamp, timeout=3600)
+        self.mock_provider_a.health_check.return_value = True
+        self.mock_provider_a.get_weather_forecast.return_value = (
+            WeatherForecastResponseSchema(
+                temperature=20.0,
+                humidity=60,
+                condition="sunny",
+                forecast_date="2024-01-15"
+            )
+        )
+        self.mock_provider_b.get_weather_forecast.return_value = (
+            WeatherForecastResponseSchema(
+                temperature=15.0,
+                humidity=70,
+                condition="cloudy",
+                forecast_date="2024-01-20"
+            )
+        )
+
+        # 복구를 기다리지 않고 external이 응답, 라우팅은 external로 고정하지 않음
+        first = self.router.route_request(user_id=1, request_data=self.request_data)
+        self.assertEqual(first.temperature, 15.0)
+        self.assertFalse(cache.has_key("api:failed:scraping"))
+        self.assertIsNone(cache.get("routing:current"))
+
+        # 다음 요청은 복구된 scraping 사용
+        second = self.router.route_request(
+            user_id=2, request_data=BUSAN_EXTERNAL_REQUEST
+        )
+        self.assertEqual(second.temperature, 20.0)
+        self.assertEqual(cache.get("routing:current"), "scraping")
+        self.mock_provider_b.get_weather_forecast.assert_called_once()
 
-    def test_lazy_recovery_fails(self):
-        """Lazy 복구 시도 실패 시"""
-        # scraping을 실패 상태로 마킹 (과거 시점)
-        past_timestamp = time.time() - 120  # 2분 전
+    def test_lazy_recovery_does_not_block_when_provider_available(self):
+        """정상 Provider가 있으면 복구 헬스체크를 기다리지 않음"""
+        past_timestamp = FROZEN_NOW - 120  # 2분 전
         cache.set("api:failed:scraping", past_timestamp, timeout=3600)
 
-        # 헬스체크 실패로 설정
+        release = threading.Event()
+        finished = threading.Event()
+
+        def health_check():
+            release.wait(1)
+            finished.set()
+            return True
+
+        self.mock_provider_a.health_check.side_effect = health_check
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        with patch("apps.weather.services.api_router._recovery_executor", executor):
+            selected = self.router._select_provider(request_data=self.request_data)
+            self.assertFalse(finished.is_set())
+            release.set()
+
+        self.assertEqual(selected, "external")
+        self.assertTrue(finished.wait(1))
+
+    def test_background_recovery_submitted_once_while_in_flight(self):
+        """같은 Provider의 백그라운드 복구가 예약/실행 중이면 다시 제출하지 않음"""
+        past_timestamp = FROZEN_NOW - 120  # 2분 전
+        cache.set("api:failed:scraping", past_timestamp, timeout=3600)
         self.mock_provider_a.health_check.return_value = False
 
-        # Provider 선택
-        selected = self.router._select_provider(user_id=7, request_data=self.request_data)
+        recovery_executor = MagicMock()
+        bookkeeping_executor = MagicMock()
+        with patch(
+            "apps.weather.services.api_router._recovery_executor", recovery_executor
+        ), patch(
+            "apps.weather.services.api_router._bookkeeping_executor",
+            bookkeeping_executor,
+        ):
+            for _ in range(3):
+                self.router._select_provider(request_data=self.request_data)
+
+            # 성공 기록용 스레드는 사용하지 않고, 복구 작업은 한 번만 제출
+            bookkeeping_executor.submit.assert_not_called()
+            recovery_executor.submit.assert_called_once()
+
+            # 예약된 복구가 끝나면 다음 재시도 시점에 다시 제출 가능
+            fn, *args = recovery_executor.submit.call_args.args
+            fn(*args)
+            cache.set("api:failed:scraping", past_timestamp, timeout=3600)
+            cache.delete("api:recovery_lock:scraping")
+            self.router._select_provider(request_data=self.request_data)
+
+        self.assertEqual(recovery_executor.submit.call_count, 2)
+
+    def test_lazy_recovery_skipped_while_another_worker_holds_lock(self):
+        """다른 워커가 복구 헬스체크 중이면 헬스체크 생략"""
+        past_timestamp = FROZEN_NOW - 120  # 2분 전
+        cache.set("api:failed:scraping", past_timestamp, timeout=3600)
+        cache.add("api:recovery_lock:scraping", 1, timeout=10)
+
+        selected = self.router._select_provider(request_data=self.request_data)
 
-        # 여전히 external 선택
         self.assertEqual(selected, "external")
-        self.mock_provider_a.health_check.assert_called_once()
+        self.mock_provider_a.health_check.assert_not_called()
+        # 실패 기록은 헬스체크 중인 워커가 갱신
+        self.assertEqual(cache.get("api:failed:scraping"), past_timestamp)
 
-        # 실패 기록이 여전히 존재 (갱신됨)
-        failed_timestamp = cache.get("api:failed:scraping")
-        self.assertIsNotNone(failed_timestamp)
+    def test_lazy_recovery_runs_health_checks_concurrently(self):
+        """여러 Provider 복구 시 헬스체크 병렬 실행"""
+        # 두 Provider 모두 실패 상태로 마킹 (과거 시점)
+        past_timestamp = FROZEN_NOW - 120  # 2분 전
+        cache.set("api:failed:scraping", past_timestamp, timeout=3600)
+        cache.set("api:failed:external", past_timestamp, timeout=3600)
+
+        # 두 헬스체크가 동시에 진행 중이어야 통과하는 배리어
+        barrier = threading.Barrier(2, timeout=1)
+
+        def health_check():
+            barrier.wait()
+            return True
+
+        self.mock_provider_a.health_check.side_effect = health_check
+        self.mock_provider_b.health_check.side_effect = health_check
+
+        selected = self.router._select_provider(request_data=self.request_data)
+
+        # 모두 복구되어 무료인 scraping 선택
+        self.assertEqual(selected, "scraping")
+        self.assertFalse(cache.has_key("api:failed:scraping"))
+        self.assertFalse(cache.has_key("api:failed:external"))
+
+    def test_lazy_recovery_deadline_exceeded(self):
+        """복구 헬스체크가 제한 시간을 넘기면 복구 실패로 처리"""
+        # 사용 가능한 Provider가 없어 복구 헬스체크를 기다리는 경우
+        past_timestamp = FROZEN_NOW - 120  # 2분 전
+        cache.set("api:failed:scraping", past_timestamp, timeout=3600)
+        cache.set("api:failed:external", past_timestamp, timeout=3600)
+        self.mock_provider_b.health_check.return_value = True
+
+        # 헬스체크가 끝나지 않도록 대기
+        release = threading.Event()
+        self.addCleanup(release.set)
+        self.mock_provider_a.health_check.side_effect = lambda: release.wait(1)
+
+        with patch.object(APIRouter, "RECOVERY_CHECK_DEADLINE_SECONDS", 0.05):
+            selected = self.router._select_provider(request_data=self.request_data)
+
+        # 느린 scraping을 기다리지 않고 external 선택
+        self.assertEqual(selected, "external")
+
+    async def test_lazy_recovery_async_runs_health_checks_concurrently(self):
+        """비동기 복구 시 health_check_async 동시 실행"""
+        past_timestamp = FROZEN_NOW - 120  # 2분 전
+        cache.set("api:failed:scraping", past_timestamp, timeout=3600)
+        cache.set("api:failed:external", past_timestamp, timeout=3600)
+
+        # 두 헬스체크가 동시에 진행 중이어야 통과
+        started = []
+        both_started = asyncio.Event()
+
+        async def health_check_async():
+            started.append(True)
+            if len(started) == 2:
+                both_started.set()
+            await both_started.wait()
+            return True
+
+        self.mock_provider_a.health_check_async = AsyncMock(side_effect=health_check_async)
+        self.mock_provider_b.health_check_async = AsyncMock(side_effect=health_check_async)
+
+        selected = await asyncio.wait_for(
+            self.router._select_provider_async(request_data=self.request_data),
+            timeout=1,
+        )
+
+        self.assertEqual(selected, "scraping")
+        self.assertFalse(cache.has_key("api:failed:scraping"))
+        self.assertFalse(cache.has_key("api:failed:external"))
+        self.mock_provider_a.health_check.assert_not_called()
+
+    def test_jittered_ttl_within_ratio(self):
+        """TTL 편차는 ±TTL_JITTER_RATIO 범위 내"""
+        ttls = {self.router._jittered(3600) for _ in range(50)}
 
-    def test_should_retry_provider_within_interval(self):
-        """재시도 간격 내에는 재시도 불가"""
-        # 30초 전 실패
-        recent_timestamp = time.time() - 30
-        cache.set("api:failed:scraping", recent_timestamp, timeout=3600)
+        self.assertTrue(all(3060 <= ttl <= 4140 for ttl in ttls))
+        self.assertGreater(len(ttls), 1)
 
-        should_retry = self.router._should_retry_provider("scraping")
+    def test_should_retry_provider(self):
+        """재시도 간격(1분) 내에는 재시도 불가, 지나면 재시도 가능"""
+        for seconds_ago, expected in [(30, False), (120, True)]:
+            with self.subTest(seconds_ago=seconds_ago):
+                cache.set(
+                    "api:failed:scraping", FROZEN_NOW - seconds_ago, timeout=3600
+                )
 
-        # 아직 1분이 안 지났으므로 False
-        self.assertFalse(should_retry)
+                self.assertEqual(
+                    self.router._should_retry_provider("scraping"), expected
+                )
 
-    def test_should_retry_provider_after_interval(self):
-        """재시도 간격 후에는 재시도 가능"""
-        # 2분 전 실패
-        old_timestamp = time.time() - 120
-        cache.set("api:failed:scraping", old_timestamp, timeout=3600)
+    def test_retry_jitter_fixed_per_failure(self):
+        """재시도 지연은 같은 실패 기록에 대해 항상 같고, 확인할 때마다 다시 뽑지 않음"""
+        last_failed_at = FROZEN_NOW - 120
+        jitters = {
+            self.router._retry_jitter("scraping", last_failed_at) for _ in range(50)
+        }
 
-        should_retry = self.router._should_retry_provider("scraping")
+        self.assertEqual(len(jitters), 1)
+        jitter = jitters.pop()
+        self.assertGreaterEqual(jitter, 0)
+        self.assertLess(jitter, APIRouter.RETRY_JITTER_SECONDS)
 
-        # 1분이 지났으므로 True
-        self.assertTrue(should_retry)
+        # 지연이 끝나기 전에는 몇 번을 확인해도 재시도하지 않음
+        due_at = last_failed_at + APIRouter.RETRY_INTERVAL_SECONDS + jitter
+        with patch.object(
+            APIRouter, "_current_timestamp", return_value=int(due_at)
+        ):
+            self.assertFalse(
+                any(
+                    self.router._is_retry_due("scraping", last_failed_at)
+                    for _ in range(50)
+                )
+            )
+        with patch.object(
+            APIRouter, "_current_timestamp", return_value=int(due_at) + 1
+        ):
+            self.assertTrue(self.router._is_retry_due("scraping", last_failed_at))
+
+    def test_failed_timestamp_stored_as_int(self):
+        """실패 시각은 초 단위 정수 Unix timestamp로 저장"""
+        self.router._mark_provider_failed("scraping")
+
+        self.assertEqual(cache.get("api:failed:scraping"), FROZEN_NOW)
+
+        # 실제 시계는 소수점 이하를 버린 정수로 변환
+        self.clock_patcher.stop()
+        with patch(
+            "apps.weather.services.api_router.time.time",
+            return_value=FROZEN_NOW + 0.75,
+        ):
+            now = self.router._current_timestamp()
+
+        self.assertIsInstance(now, int)
+        self.assertEqual(now, FROZEN_NOW)
 
     def test_success_clears_failed_status(self):
         """성공 시 실패 상태 자동 삭제"""
         # 실패 상태로 시작
         self.router._mark_provider_failed("scraping")
-        self.assertIsNotNone(cache.get("api:failed:scraping"))
+        self.assertTrue(cache.has_key("api:failed:scraping"))
 
         # 성공 응답 설정
         mock_response = WeatherForecastResponseSchema(
@@ -233,7 +1050,7 @@ class TestAPIRouter(TestCase):
         self.mock_provider_a.get_weather_forecast.return_value = mock_response
 
         # 캐시에 scraping 할당
-        cache.set("routing:8", "scraping", timeout=3600)
+        cache.set("routing:current", "scraping", timeout=3600)
 
         # 실행
         self.router.route_request(user_id=8, request_data=self.request_data)
@@ -257,3 +1074,164 @@ class TestAPIRouter(TestCase):
 
         self.assertEqual(success_count, 2)
         self.assertEqual(failure_count, 1)
+
+
+class TestAPIRouterRedisPipeline(SimpleTestCase):
+    """Redis 백엔드 파이프라인 경로 테스트 (키 접두사, 직렬화, TTL)"""
+
+    def setUp(self):
+        super().setUp()
+
+        # 운영과 같은 django-redis 백엔드 (명령은 파이프라인에 기록만 하고 서버에 연결하지 않음)
+        self.redis_cache = RedisCache(
+            "redis://127.0.0.1:6379/1", {"KEY_PREFIX": "weather"}
+        )
+        self.pipeline = _RecordingPipeline()
+        for patcher in (
+            patch("apps.weather.services.api_router.cache", self.redis_cache),
+            patch.object(
+                APIRouter, "_get_redis_pipeline", return_value=self.pipeline
+            ),
+            patch.object(APIRouter, "_current_timestamp", return_value=FROZEN_NOW),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        # 호출되지 않으므로 이름과 비용만 가진 Stub 사용
+        self.router = APIRouter(
+            providers=[
+                SimpleNamespace(provider_name="scraping", cost_per_request=0.0),
+                SimpleNamespace(provider_name="external", cost_per_request=0.01),
+            ]
+        )
+
+    def assertJitteredTTL(self, ttl, base):
+        """TTL이 기준값의 ±TTL_JITTER_RATIO 범위 내인지 확인"""
+        ratio = APIRouter.TTL_JITTER_RATIO
+        self.assertGreaterEqual(ttl, int(base * (1 - ratio)))
+        self.assertLessEqual(ttl, int(base * (1 + ratio)))
+
+    def test_write_success_pipelines_routing_metric_and_clear(self):
+        """성공 기록: 라우팅 저장, 성공 메트릭, 실패 기록 삭제를 한 번에 전송"""
+        self.router._write_success("external", metrics_only=False, clear_failed=True)
+
+        # 새로 생성된 카운터의 TTL만 다음 왕복에서 설정
+        self.assertEqual(self.pipeline.execute_count, 2)
+        (set_routing, incr, delete, expire) = self.pipeline.commands
+
+        # cache.get()으로 읽을 수 있도록 접두사와 직렬화 형식이 같아야 함
+        self.assertEqual(set_routing[:2], ("set", "weather:1:routing:current"))
+        self.assertEqual(self.redis_cache.client.decode(set_routing[2]), "external")
+        self.assertJitteredTTL(set_routing[3], APIRouter.ROUTING_CACHE_TTL)
+
+        self.assertEqual(incr, ("incr", "weather:1:api:metrics:external:success"))
+        self.assertEqual(delete, ("delete", "weather:1:api:failed:external"))
+
+        self.assertEqual(expire[:2], ("expire", "weather:1:api:metrics:external:success"))
+        self.assertJitteredTTL(expire[2], APIRouter.METRICS_CACHE_TTL)
+
+    def test_write_success_skips_clear_when_not_failed(self):
+        """실패 기록이 없다고 알려진 경우 삭제 명령 생략"""
+        self.router._write_success("scraping", metrics_only=False, clear_failed=False)
+
+        self.assertEqual(
+            [command[0] for command in self.pipeline.commands],
+            ["set", "incr", "expire"],
+        )
+
+    def test_write_success_keeps_ttl_of_existing_counter(self):
+        """성공 기록: 이미 있는 성공 카운터는 EXPIRE 없이 한 번의 왕복으로 전송"""
+        self.pipeline.counters["weather:1:api:metrics:external:success"] = 3
+
+        self.router._write_success("external", metrics_only=False, clear_failed=True)
+
+        self.assertEqual(self.pipeline.execute_count, 1)
+        self.assertEqual(
+            [command[0] for command in self.pipeline.commands],
+            ["set", "incr", "delete"],
+        )
+
+    def test_record_failure_pipelines_metric_and_timestamp(self):
+        """실패 기록: 실패 메트릭과 실패 타임스탬프를 한 번에 전송"""
+        self.router._record_failure("scraping")
+
+        self.assertEqual(self.pipeline.execute_count, 2)
+        (incr, set_failed, expire) = self.pipeline.commands
+
+        self.assertEqual(incr, ("incr", "weather:1:api:metrics:scraping:failure"))
+
+        self.assertEqual(set_failed[:2], ("set", "weather:1:api:failed:scraping"))
+        self.assertEqual(self.redis_cache.client.decode(set_failed[2]), FROZEN_NOW)
+        self.assertJitteredTTL(set_failed[3], APIRouter.FAILED_CACHE_TTL)
+
+        self.assertEqual(expire[:2], ("expire", "weather:1:api:metrics:scraping:failure"))
+        self.assertJitteredTTL(expire[2], APIRouter.METRICS_CACHE_TTL)
+
+    def test_record_failure_keeps_ttl_of_existing_counter(self):
+        """실패 기록: 이미 있는 실패 카운터는 TTL을 연장하지 않고 실패 시각만 갱신"""
+        self.pipeline.counters["weather:1:api:metrics:scraping:failure"] = 2
+
+        self.router._record_failure("scraping")
+
+        self.assertEqual(self.pipeline.execute_count, 1)
+        self.assertEqual(
+            [command[0] for command in self.pipeline.commands], ["incr", "set"]
+        )
+        self.assertEqual(
+            self.pipeline.counters["weather:1:api:metrics:scraping:failure"], 3
+        )
+
+    def test_set_cached_forecasts_pipelines_forecast_and_last_good(self):
+        """예보 캐시와 마지막 정상 응답을 한 번의 왕복으로 저장"""
+        response = WeatherForecastResponseSchema(
+            temperature=20.0,
+            humidity=60,
+            condition="sunny",
+            forecast_date="2024-01-15"
+        )
+
+        self.router._set_cached_forecasts({"abc": response})
+
+        self.assertEqual(self.pipeline.execute_count, 1)
+        (set_forecast, set_last_good) = self.pipeline.commands
+
+        self.assertEqual(set_forecast[:2], ("set", "weather:1:api:forecast:abc"))
+        self.assertEqual(set_forecast[3], APIRouter.FORECAST_CACHE_TTL)
+        self.assertEqual(set_last_good[:2], ("set", "weather:1:api:last_good:abc"))
+        self.assertEqual(set_last_good[3], APIRouter.LAST_GOOD_CACHE_TTL)
+
+        for command in (set_forecast, set_last_good):
+            self.assertEqual(
+                WeatherForecastResponseSchema.model_validate_json(
+                    self.redis_cache.client.decode(command[2])
+                ),
+                response,
+            )
+
+    def test_increment_metric_sets_ttl_only_on_new_counter(self):
+        """메트릭 증가: 카운터를 새로 만든 INCR에만 EXPIRE (접두사 적용된 같은 키)"""
+        self.router._increment_metric("api:metrics:scraping:cache_hit")
+
+        self.assertEqual(self.pipeline.execute_count, 2)
+        (incr, expire) = self.pipeline.commands
+
+        self.assertEqual(incr, ("incr", "weather:1:api:metrics:scraping:cache_hit"))
+        self.assertEqual(
+            expire[:2], ("expire", "weather:1:api:metrics:scraping:cache_hit")
+        )
+        self.assertJitteredTTL(expire[2], APIRouter.METRICS_CACHE_TTL)
+
+    def test_increment_metric_keeps_ttl_of_existing_counter(self):
+        """메트릭 증가: 이미 있는 카운터는 TTL을 연장하지 않음 (고정 윈도우)"""
+        self.pipeline.counters["weather:1:api:metrics:scraping:cache_hit"] = 5
+
+        self.router._increment_metric("api:metrics:scraping:cache_hit")
+
+        self.assertEqual(self.pipeline.execute_count, 1)
+        self.assertEqual(
+            self.pipeline.commands,
+            [("incr", "weather:1:api:metrics:scraping:cache_hit")],
+        )
+        self.assertEqual(
+            self.pipeline.counters["weather:1:api:metrics:scraping:cache_hit"], 6
+        )
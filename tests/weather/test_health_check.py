@@ -0,0 +1,127 @@
+# tests/weather/test_health_check.py
+"""
+헬스체크 ASGI 인터셉터 테스트
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from django.test import SimpleTestCase
+from django.core.cache import cache
+
+from apps.weather.health_check import HealthCheckInterceptor
+from apps.weather.services.api_router import APIRouter
+from tests.mixins import IsolatedCacheMixin
+
+
+class TestHealthCheckInterceptor(IsolatedCacheMixin, SimpleTestCase):
+    """헬스체크 인터셉터 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        # Stub Provider 생성 (상태 요약만 확인하므로 호출되지 않음, 클래스당 한 번 생성)
+        cls.stub_provider_a = SimpleNamespace(
+            provider_name="scraping", cost_per_request=0.0
+        )
+        cls.stub_provider_b = SimpleNamespace(
+            provider_name="external", cost_per_request=0.01
+        )
+
+    def setUp(self):
+        super().setUp()
+
+        router = APIRouter(providers=[self.stub_provider_a, self.stub_provider_b])
+        patcher = patch(
+            "apps.weather.health_check.get_api_router", return_value=router
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # 내부 Django 앱 (호출 여부만 확인)
+        self.inner_app = AsyncMock()
+        self.interceptor = HealthCheckInterceptor(self.inner_app)
+
+    async def _request(self, path, method="GET"):
+        """인터셉터에 HTTP 요청을 보내고 (status, headers, body) 반환"""
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {"type": "http", "path": path, "method": method}
+        await self.interceptor(scope, AsyncMock(), send)
+
+        if not messages:
+            return None, None, None
+        return (
+            messages[0]["status"],
+            dict(messages[0]["headers"]),
+            messages[1]["body"],
+        )
+
+    async def test_ready_reports_provider_status(self):
+        """캐시 조회가 되면 200, Provider 상태는 본문에 포함"""
+        cache.set("api:failed:scraping", 1729732800.0, timeout=3600)
+
+        status, headers, body = await self._request("/readyz")
+
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b"content-type"], b"application/json")
+        self.assertEqual(
+            json.loads(body),
+            {
+                "status": "ready",
+                "upstream": "healthy",
+                "providers": {"scraping": "unhealthy", "external": "healthy"},
+            },
+        )
+        self.inner_app.assert_not_called()
+
+    async def test_ready_when_all_providers_failed(self):
+        """모든 Provider가 실패 상태여도 200 (공유 실패 기록으로 전체 Pod가 빠지지 않도록)"""
+        cache.set("api:failed:scraping", 1729732800.0, timeout=3600)
+        cache.set("api:failed:external", 1729732800.0, timeout=3600)
+
+        status, _, body = await self._request("/readyz")
+
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)["status"], "ready")
+        self.assertEqual(json.loads(body)["upstream"], "unhealthy")
+
+    async def test_not_ready_when_cache_unreachable(self):
+        """캐시 조회에 실패하면 503"""
+        with patch.object(
+            APIRouter, "get_health_summary", side_effect=ConnectionError("down")
+        ):
+            status, _, body = await self._request("/readyz")
+
+        self.assertEqual(status, 503)
+        self.assertEqual(json.loads(body), {"status": "not_ready"})
+
+    async def test_liveness_ignores_provider_state(self):
+        """/healthz는 모든 Provider가 실패 상태여도 200 (Pod 재시작 방지)"""
+        cache.set("api:failed:scraping", 1729732800.0, timeout=3600)
+        cache.set("api:failed:external", 1729732800.0, timeout=3600)
+
+        with patch.object(APIRouter, "get_health_summary") as mock_summary:
+            status, _, body = await self._request("/healthz")
+
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body), {"status": "alive"})
+        mock_summary.assert_not_called()
+        self.inner_app.assert_not_called()
+
+    async def test_non_get_method_not_allowed(self):
+        """GET 이외의 메서드는 405"""
+        status, headers, _ = await self._request("/healthz", method="POST")
+
+        self.assertEqual(status, 405)
+        self.assertEqual(headers[b"allow"], b"GET")
+
+    async def test_other_paths_pass_through(self):
+        """헬스체크 이외의 경로는 Django 앱으로 전달"""
+        await self._request("/api/v1/weather/forecast/")
+
+        self.inner_app.assert_awaited_once()
@@ -3,8 +3,11 @@
 API Provider 테스트
 """
 
-from unittest.mock import patch, MagicMock
-from django.test import TestCase
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch, MagicMock
+from django.core.cache import cache
+from django.test import SimpleTestCase
 
 from apps.weather.services.api_providers.scraping_provider import ScrapingWeatherProvider
 from apps.weather.services.api_providers.external_provider import ExternalWeatherProvider
@@ -15,115 +18,277 @@ from apps.weather.services.weather_api.schemas import (
     DateRangeSchema,
     ForecastOptionsSchema,
 )
+from tests.mixins import IsolatedCacheMixin
+from tests.weather.fixtures import BUSAN_EXTERNAL_REQUEST, SEOUL_REQUEST
 
 
-class TestScrapingProvider(TestCase):
+class TestScrapingProvider(IsolatedCacheMixin, SimpleTestCase):
     """스크래핑 Provider 테스트"""
 
+    # 요청 데이터 (모듈 공용 인스턴스)
+    request_data = SEOUL_REQUEST
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        # Provider는 클래스당 한 번 생성 (세션 호출은 테스트마다 패치 후 복원)
+        cls.provider = ScrapingWeatherProvider(api_key="test-key")
+        cls.addClassCleanup(cls.provider.session.close)
+
     def setUp(self):
-        self.provider = ScrapingWeatherProvider(api_key="test-key")
+        # 헬스체크 결과 캐시는 테스트마다 격리
+        super().setUp()
+
+        # 세션 HTTP 호출은 모든 테스트에서 공통으로 패치
+        self.mock_post = self._patch_session("post")
+        self.mock_get = self._patch_session("get")
+
+    def _patch_session(self, method):
+        """Provider 세션의 HTTP 메서드를 테스트 종료 시까지 Mock으로 교체"""
+        patcher = patch.object(self.provider.session, method)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
 
     def test_provider_metadata(self):
         """Provider 메타데이터 확인"""
         self.assertEqual(self.provider.provider_name, "scraping")
         self.assertEqual(self.provider.cost_per_request, 0.0)
 
-    @patch("apps.weather.services.api_providers.scraping_provider.requests.post")
-    def test_get_weather_forecast_success(self, mock_post):
+    def test_get_weather_forecast_success(self):
         """날씨 예보 조회 성공 케이스"""
         # Mock 응답 설정
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
+        mock_response.content = json.dumps({
+            "common": {"errYn": "N"},
             "data": {
                 "temperature": 20.5,
                 "humidity": 60,
                 "condition": "sunny",
                 "forecast_date": "2024-01-15"
             },
-            "error": None
-        }
-        mock_post.return_value = mock_response
-
-        # 요청 데이터 생성
-        request_data = WeatherForecastRequestSchema(
-            api_key="test-key",
-            location=LocationSchema(city="Seoul", country_code="KR"),
-            date_range=DateRangeSchema(start="2024-01-01", end="2024-01-31"),
-            options=ForecastOptionsSchema(include_hourly="N", units="metric"),
-        )
+        }).encode()
+        self.mock_post.return_value = mock_response
 
         # 실행
-        response = self.provider.get_weather_forecast(request_data)
+        response = self.provider.get_weather_forecast(self.request_data)
 
         # 검증
         self.assertIsInstance(response, WeatherForecastResponseSchema)
         self.assertEqual(response.temperature, 20.5)
-        mock_post.assert_called_once()
+        self.mock_post.assert_called_once()
+
+    async def test_get_weather_forecast_async_success(self):
+        """비동기 날씨 예보 조회 성공 케이스"""
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({
+            "common": {"errYn": "N"},
+            "data": {
+                "temperature": 20.5,
+                "humidity": 60,
+                "condition": "sunny",
+                "forecast_date": "2024-01-15"
+            },
+        }).encode()
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock(return_value=mock_response)
+
+        with patch.object(
+            ScrapingWeatherProvider, "_get_async_client", return_value=mock_client
+        ):
+            response = await self.provider.get_weather_forecast_async(self.request_data)
+
+        self.assertIsInstance(response, WeatherForecastResponseSchema)
+        self.assertEqual(response.temperature, 20.5)
+        mock_client.post.assert_awaited_once()
 
-    @patch("apps.weather.services.api_providers.scraping_provider.requests.get")
-    def test_health_check_success(self, mock_get):
+    def test_health_check_success(self):
         """헬스체크 성공 케이스"""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = mock_response
 
         result = self.provider.health_check()
 
         self.assertTrue(result)
 
-    @patch("apps.weather.services.api_providers.scraping_provider.requests.get")
-    def test_health_check_failure(self, mock_get):
+    def test_health_check_failure(self):
         """헬스체크 실패 케이스"""
-        mock_get.side_effect = Exception("Connection error")
+        self.mock_get.side_effect = Exception("Connection error")
 
         result = self.provider.health_check()
 
         self.assertFalse(result)
 
+    def test_health_check_result_is_cached(self):
+        """TTL 내 연속 헬스체크는 캐시된 결과 사용"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        self.mock_get.return_value = mock_response
+
+        self.assertTrue(self.provider.health_check())
+        self.assertTrue(self.provider.health_check())
+
+        # 실제 요청은 한 번만
+        self.mock_get.assert_called_once()
+
+    async def test_health_check_async_success(self):
+        """비동기 헬스체크는 공유 AsyncClient 사용"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+
+        with patch.object(
+            ScrapingWeatherProvider, "_get_async_client", return_value=mock_client
+        ):
+            result = await self.provider.health_check_async()
+
+        self.assertTrue(result)
+        mock_client.get.assert_awaited_once()
+
+    async def test_health_check_async_result_is_cached(self):
+        """비동기 헬스체크 결과도 비동기 캐시 API로 캐싱"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+
+        with patch.object(
+            ScrapingWeatherProvider, "_get_async_client", return_value=mock_client
+        ), patch.object(cache, "aget", wraps=cache.aget) as mock_aget:
+            self.assertTrue(await self.provider.health_check_async())
+            self.assertTrue(await self.provider.health_check_async())
+
+        # 실제 요청은 한 번만, 캐시 조회는 비동기 API 사용
+        mock_client.get.assert_awaited_once()
+        self.assertEqual(mock_aget.await_count, 2)
+
+    def test_async_client_per_event_loop(self):
+        """AsyncClient는 이벤트 루프별로 생성되고 aclose_async_client로 종료"""
+        async def get_clients_and_close():
+            client = self.provider._get_async_client()
+            same = self.provider._get_async_client()
+            await self.provider.aclose_async_client()
+            return client, same
+
+        first, same = asyncio.run(get_clients_and_close())
+        second, _ = asyncio.run(get_clients_and_close())
 
-class TestExternalProvider(TestCase):
+        # 같은 루프에서는 재사용, 루프가 다르면 새 클라이언트
+        self.assertIs(first, same)
+        self.assertIsNot(first, second)
+        self.assertTrue(first.is_closed)
+        self.assertTrue(second.is_closed)
+        self.assertEqual(len(self.provider._async_clients), 0)
+
+
+class TestExternalProvider(IsolatedCacheMixin, SimpleTestCase):
     """외부 유료 Provider 테스트"""
 
+    request_data = BUSAN_EXTERNAL_REQUEST
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.provider = ExternalWeatherProvider(api_key="external-key")
+        cls.addClassCleanup(cls.provider.session.close)
+
     def setUp(self):
-        self.provider = ExternalWeatherProvider(api_key="external-key")
+        super().setUp()
+
+        # 세션 HTTP 호출은 모든 테스트에서 공통으로 패치
+        patcher = patch.object(self.provider.session, "post")
+        self.addCleanup(patcher.stop)
+        self.mock_post = patcher.start()
 
     def test_provider_metadata(self):
         """Provider 메타데이터 확인"""
         self.assertEqual(self.provider.provider_name, "external")
         self.assertEqual(self.provider.cost_per_request, 0.01)
 
-    @patch("apps.weather.services.api_providers.external_provider.requests.post")
-    def test_get_weather_forecast_success(self, mock_post):
+    def test_session_reuses_connection_pool(self):
+        """세션에 API 키 헤더와 커넥션 풀 어댑터가 설정됨"""
+        self.assertEqual(self.provider.session.headers["X-API-Key"], "external-key")
+
+        adapter = self.provider.session.get_adapter(self.provider.base_url)
+        self.assertEqual(adapter._pool_maxsize, 50)
+        self.assertEqual(adapter.max_retries.total, 1)
+
+    def test_health_check_not_retried(self):
+        """헬스체크 URL은 재시도 없는 어댑터 사용 (복구 제한 시간 안에 끝나도록)"""
+        session = self.provider.session
+
+        health_adapter = session.get_adapter(self.provider.health_endpoint)
+        self.assertEqual(health_adapter.max_retries.total, 0)
+
+        # 예보 호출은 기존 재시도 유지
+        forecast_adapter = session.get_adapter(self.provider.forecast_endpoint)
+        self.assertEqual(forecast_adapter.max_retries.total, 1)
+
+    def test_request_body_encoded_once_per_query(self):
+        """같은 조회 조건은 인코딩된 요청 바디 재사용"""
+        def make_request():
+            return WeatherForecastRequestSchema(
+                api_key="external-key",
+                location=LocationSchema(city="Busan", country_code="KR"),
+                date_range=DateRangeSchema(start="2024-01-01", end="2024-01-31"),
+                options=ForecastOptionsSchema(include_hourly="Y", units="metric"),
+            )
+
+        first = self.provider._convert_to_external_format(make_request())
+        second = self.provider._convert_to_external_format(make_request())
+
+        self.assertIs(first, second)
+        self.assertEqual(
+            json.loads(first),
+            {
+                "query": {"city": "Busan", "country": "KR"},
+                "period": {"from": "2024-01-01", "to": "2024-01-31"},
+                "settings": {"hourly": True, "unit_system": "metric"},
+            },
+        )
+
+    def test_get_weather_forecast_success(self):
         """날씨 예보 조회 성공 케이스"""
         # Mock 응답 설정
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "success": True,
+        mock_response.content = json.dumps({
+            "common": {"errYn": "N"},
             "data": {
                 "temperature": 15.0,
                 "humidity": 70,
                 "condition": "cloudy",
                 "forecast_date": "2024-01-20"
             },
-            "error": None
-        }
-        mock_post.return_value = mock_response
-
-        # 요청 데이터 생성
-        request_data = WeatherForecastRequestSchema(
-            api_key="external-key",
-            location=LocationSchema(city="Busan", country_code="KR"),
-            date_range=DateRangeSchema(start="2024-01-01", end="2024-01-31"),
-            options=ForecastOptionsSchema(include_hourly="Y", units="metric"),
-        )
+        }).encode()
+        self.mock_post.return_value = mock_response
 
         # 실행
-        response = self.provider.get_weather_forecast(request_data)
+        response = self.provider.get_weather_forecast(self.request_data)
 
         # 검증
         self.assertIsInstance(response, WeatherForecastResponseSchema)
         self.assertEqual(response.temperature, 15.0)
-        mock_post.assert_called_once()
+        self.mock_post.assert_called_once()
+
+    async def test_get_weather_forecast_async_api_error(self):
+        """비동기 조회 시 에러 응답이면 예외 발생"""
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({
+            "common": {"errYn": "Y", "errMsg": "quota exceeded"},
+            "data": None,
+        }).encode()
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock(return_value=mock_response)
+
+        with patch.object(
+            ExternalWeatherProvider, "_get_async_client", return_value=mock_client
+        ):
+            with self.assertRaises(Exception) as context:
+                await self.provider.get_weather_forecast_async(self.request_data)
+
+        self.assertIn("quota exceeded", str(context.exception))